@@ -1,5 +1,6 @@
 import requests
 from requests.auth import HTTPDigestAuth
+from requests.adapters import HTTPAdapter
 import time
 import json
 import re
@@ -15,9 +16,41 @@ _PATTERN_AREAID = re.compile(r"VideoAnalyseRule\[0\]\[(\d+)\]\.Config\.AreaID\s*
 _PATTERN_B = re.compile(r"(?:table\s*\.)?VideoAnalyseRule\[\d+\]\[(\d+)\]\.Config\.DetectRegion\[\d+\]\[(\d+)\]\s*=\s*(\d+)\s*,\s*(\d+)", re.IGNORECASE)
 _PATTERN_C = re.compile(r"(?:table\s*\.)?VideoAnalyseRule\[\d+\]\[(\d+)\]\.Config\.DetectRegion\[(\d+)\]\[(\d+)\]\s*=\s*(\d+)", re.IGNORECASE)
 _PATTERN_ENABLE_IDX = re.compile(r"VideoAnalyseRule\[0\]\[(\d+)\]\.Enable\s*=\s*true", re.IGNORECASE)
+_PATTERN_REGION0 = re.compile(r"VideoAnalyseRule\[0\]\[(\d+)\]\.Config\.DetectRegion\[0\]\[0\]=", re.IGNORECASE)
 
 logger = get_logger(__name__)
 
+# 단발성 CGI 요청용 공유 세션 (keep-alive 커넥션 풀 재사용)
+# urllib3 기본 소켓 옵션에 TCP_NODELAY가 포함되어 있으므로 별도 설정 불필요
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+_AUTH_CACHE = {} # {(ip, user): HTTPDigestAuth} - 스레드별 nonce 재사용 (비밀번호 변경 시 교체)
+
+
+def _get_session() -> requests.Session:
+    """공유 CGI 세션을 반환합니다. (최초 호출 시 생성)"""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0)
+                session.mount("http://", adapter)
+                _SESSION = session
+    return _SESSION
+
+
+def _get_auth(ip: str, user: str, password: str) -> HTTPDigestAuth:
+    """카메라별 Digest 인증 객체를 재사용합니다. (nonce 유지로 401 왕복 절감)"""
+    key = (ip, user)
+    auth = _AUTH_CACHE.get(key)
+    if auth is None or auth.password != password:
+        with _SESSION_LOCK:
+            auth = _AUTH_CACHE.get(key)
+            if auth is None or auth.password != password:
+                auth = _AUTH_CACHE[key] = HTTPDigestAuth(user, password)
+    return auth
+
 
 def build_rtsp_url(camera_config: dict) -> str:
     """
@@ -267,13 +300,15 @@ class StayDetectionThread(_BaseCgiThread):
         except Exception as e:
             self._log_rate_limit("stay_parse", f"Stay parse error: {e}")
 
-def fetch_region_data(ip: str, user: str, password: str) -> str | None:
+def fetch_region_data(ip: str, user: str, password: str, session: requests.Session | None = None, timeout=5) -> str | None:
     """
     VideoAnalyseRule CGI에서 영역 좌표 설정 원문을 가져옵니다. (1121 이식)
+    session을 넘기지 않으면 모듈 공유 세션(커넥션 풀)을 사용합니다.
     """
     url = f"http://{ip}/cgi-bin/configManager.cgi?action=getConfig&name=VideoAnalyseRule"
+    http = session if session is not None else _get_session()
     try:
-        resp = requests.get(url, auth=HTTPDigestAuth(user, password), timeout=5)
+        resp = http.get(url, auth=_get_auth(ip, user, password), timeout=timeout)
         if resp.status_code == 200 and resp.text:
             return resp.text
         else:
@@ -285,22 +320,21 @@ def fetch_region_data(ip: str, user: str, password: str) -> str | None:
             logger.error(f"[CGI] fetch_region_data error: {e}")
         return None
 
-def get_roi_raw_data(ip: str, user: str, password: str) -> str | None:
+def get_roi_raw_data(ip: str, user: str, password: str, session: requests.Session | None = None) -> str | None:
     """ROI 설정을 위한 원문 데이터를 가져옵니다. (fetch_region_data 래퍼)"""
-    return fetch_region_data(ip, user, password)
+    return fetch_region_data(ip, user, password, session=session)
 
 def parse_region_count(cgi_text: str) -> int:
     """CGI 텍스트에서 활성화된 영역 개수를 파싱합니다. (1121 이식)"""
     if not cgi_text:
         return 0
+    # 인덱스별 패턴을 매번 컴파일하지 않고, 모듈 레벨 패턴으로 1회씩만 스캔
     rule_indices = set(_PATTERN_ENABLE_IDX.findall(cgi_text))
-    count = 0
-    for idx in rule_indices:
-        areaid_pattern = rf'VideoAnalyseRule\[0\]\[{idx}\]\.Config\.AreaID='
-        region_pattern = rf'VideoAnalyseRule\[0\]\[{idx}\]\.Config\.DetectRegion\[0\]\[0\]='
-        if re.search(areaid_pattern, cgi_text, re.IGNORECASE) and re.search(region_pattern, cgi_text, re.IGNORECASE):
-            count += 1
-    return count
+    if not rule_indices:
+        return 0
+    with_area = {idx for idx, _ in _PATTERN_AREAID.findall(cgi_text)}
+    with_region = set(_PATTERN_REGION0.findall(cgi_text))
+    return len(rule_indices & with_area & with_region)
 
 def get_roi_config(ip, user, password):
     """
@@ -308,26 +342,28 @@ def get_roi_config(ip, user, password):
     Returns: { area_id (int): { 'index': int, 'enable': bool }, ... }
     """
     text = fetch_region_data(ip, user, password)
-    if not text:
+    return parse_roi_config(text)
+
+def parse_roi_config(cgi_text: str) -> dict:
+    """
+    이미 가져온 CGI 텍스트에서 AreaID별 활성화 상태를 파싱합니다. (fetch 없음)
+    Returns: { area_id (int): { 'index': int, 'enable': bool }, ... }
+    """
+    if not cgi_text:
         return {}
-    
+
+    # 룰 인덱스별 Enable 값 (1회 스캔)
+    enable_by_rule = {idx: val.lower() == 'true' for idx, val in _PATTERN_ENABLE.findall(cgi_text)}
+
     config = {}
-    # Regex to find indices e.g. table.VideoAnalyseRule[0][0]
-    indices = set(re.findall(r'VideoAnalyseRule\[0\]\[(\d+)\]', text))
-    
-    for idx in indices:
-        # Extract AreaID and Enable status
-        area_id_match = re.search(rf'VideoAnalyseRule\[0\]\[{idx}\]\.Config\.AreaID=(\d+)', text)
-        enable_match = re.search(rf'VideoAnalyseRule\[0\]\[{idx}\]\.Enable=(true|false)', text, re.IGNORECASE)
-        
-        if area_id_match:
-            area_id = int(area_id_match.group(1))
-            enable = (enable_match.group(1).lower() == 'true') if enable_match else False
-            
-            config[area_id] = {
-                'index': int(idx),
-                'enable': enable
-            }
+    for idx, aid in _PATTERN_AREAID.findall(cgi_text):
+        area_id = int(aid)
+        if area_id in config:
+            continue
+        config[area_id] = {
+            'index': int(idx),
+            'enable': enable_by_rule.get(idx, False)
+        }
     return config
 
 def set_roi_enable(ip, user, password, updates):
@@ -346,7 +382,7 @@ def set_roi_enable(ip, user, password, updates):
     url = f"http://{ip}/cgi-bin/configManager.cgi?action=setConfig&{query}"
     
     try:
-        resp = requests.get(url, auth=HTTPDigestAuth(user, password), timeout=5)
+        resp = _get_session().get(url, auth=_get_auth(ip, user, password), timeout=5)
         return resp.status_code == 200 and "OK" in resp.text
     except Exception as e:
         if should_log(f"set_roi_{ip}", 60)[0]:
@@ -438,7 +474,7 @@ def set_detect_region(ip: str, username: str, password: str, rule_index: int, po
             params[f"VideoAnalyseRule[0][{int(rule_index)}].Config.DetectRegion[{i}][0]"] = str(int(x))
             params[f"VideoAnalyseRule[0][{int(rule_index)}].Config.DetectRegion[{i}][1]"] = str(int(y))
             
-        resp = requests.get(base_url, params=params, auth=HTTPDigestAuth(username, password), timeout=5)
+        resp = _get_session().get(base_url, params=params, auth=_get_auth(ip, username, password), timeout=5)
         if resp.status_code != 200:
             logger.error(f"[CGI] Set ROI Failed: {resp.status_code} - {resp.text[:100]}")
             return False
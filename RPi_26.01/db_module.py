@@ -100,37 +100,57 @@ def get_db_path():
 _db_queue = queue.Queue()
 _db_thread = None
 _db_running = False
+_DB_BATCH_MAX = 64 # 1회 깨어날 때 묶어서 기록할 최대 작업 수
+
+def _run_purge_job(job_data):
+    retention_days = job_data.get('retention_days')
+    callback = job_data.get('callback')
+    try:
+        deleted_count = purge_old_events(retention_days)
+        if callback:
+            callback(deleted_count, retention_days, None)
+    except Exception as e:
+        logger.error(f"[DB] Purge Job Error: {e}")
+        if callback:
+            callback(0, retention_days, e)
 
 def _db_writer_loop():
-    """백그라운드에서 큐의 이벤트를 DB에 기록"""
+    """백그라운드에서 큐의 이벤트를 DB에 기록 (대기 중인 이벤트는 묶어서 1회 commit)"""
     while _db_running:
         try:
             # 1초 대기하며 이벤트 가져오기
-            job_data = _db_queue.get(timeout=1.0)
-
-            # 작업 유형에 따라 분기
-            if isinstance(job_data, dict) and job_data.get('job_type') == 'PURGE':
-                retention_days = job_data.get('retention_days')
-                callback = job_data.get('callback')
-                try:
-                    deleted_count = purge_old_events(retention_days)
-                    if callback:
-                        callback(deleted_count, retention_days, None)
-                except Exception as e:
-                    logger.error(f"[DB] Purge Job Error: {e}")
-                    if callback:
-                        callback(0, retention_days, e)
-            else:
-                insert_event(job_data)
-
-            _db_queue.task_done()
+            jobs = [_db_queue.get(timeout=1.0)]
         except queue.Empty:
             continue
+
+        # 이미 쌓여 있는 작업은 대기 없이 추가로 꺼냄
+        while len(jobs) < _DB_BATCH_MAX:
+            try:
+                jobs.append(_db_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        try:
+            # 작업 유형에 따라 분기 (PURGE 전 대기 중인 INSERT를 먼저 기록하여 순서 유지)
+            pending = []
+            for job_data in jobs:
+                if isinstance(job_data, dict) and job_data.get('job_type') == 'PURGE':
+                    if pending:
+                        insert_events(pending)
+                        pending = []
+                    _run_purge_job(job_data)
+                else:
+                    pending.append(job_data)
+            if pending:
+                insert_events(pending)
         except Exception as e:
             allow, suppressed = should_log("db_writer_loop_error", 60)
             if allow:
                 msg = f"[DB] Writer Loop Error: {e}" + (f" (suppressed {suppressed})" if suppressed > 0 else "")
                 logger.error(msg)
+        finally:
+            for _ in jobs:
+                _db_queue.task_done()
 
 def init_db_worker():
     """DB 쓰기 워커 시작"""
@@ -184,81 +204,136 @@ def enqueue_purge(retention_days, callback=None):
             if callback:
                 callback(0, retention_days, e)
 
-def insert_event(event_data):
-    """이벤트 데이터를 DB에 저장"""
+def _build_event_row(event_data):
+    """
+    이벤트 데이터를 INSERT 파라미터로 변환합니다.
+    Returns: ('people' | 'log', params) 또는 저장 대상이 아니면 None
+    """
     event_type = event_data.get('type', 'UNKNOWN')
     
     # [Commit 21-fix] DEBUG 로그는 DB에 저장하지 않음
     if event_type == 'DEBUG':
-        return
+        return None
 
-    try:
-        # [Commit 24-1] ts/ts_epoch 정규화 (날짜 누락 방지)
-        ts_epoch = event_data.get('ts_epoch')
-        
-        if ts_epoch is None:
-            ts_input = event_data.get('ts')
-            if ts_input:
-                try:
-                    dt = datetime.strptime(ts_input, "%Y-%m-%d %H:%M:%S")
-                    ts_epoch = int(dt.timestamp())
-                except ValueError:
-                    ts_epoch = int(time.time())
-            else:
+    # [Commit 24-1] ts/ts_epoch 정규화 (날짜 누락 방지)
+    ts_epoch = event_data.get('ts_epoch')
+    
+    if ts_epoch is None:
+        ts_input = event_data.get('ts')
+        if ts_input:
+            try:
+                dt = datetime.strptime(ts_input, "%Y-%m-%d %H:%M:%S")
+                ts_epoch = int(dt.timestamp())
+            except ValueError:
                 ts_epoch = int(time.time())
+        else:
+            ts_epoch = int(time.time())
 
-        # ts 문자열 표준화 (YYYY-MM-DD HH:MM:SS)
-        ts = datetime.fromtimestamp(ts_epoch).strftime("%Y-%m-%d %H:%M:%S")
+    # ts 문자열 표준화 (YYYY-MM-DD HH:MM:SS)
+    ts = datetime.fromtimestamp(ts_epoch).strftime("%Y-%m-%d %H:%M:%S")
 
-        # payload_json 내부의 ts/ts_epoch도 표준화된 값으로 통일
-        event_data['ts'] = ts
-        event_data['ts_epoch'] = ts_epoch
+    # payload_json 내부의 ts/ts_epoch도 표준화된 값으로 통일
+    event_data['ts'] = ts
+    event_data['ts_epoch'] = ts_epoch
 
-        camera_key = event_data.get('camera_key', '')
+    camera_key = event_data.get('camera_key', '')
+    
+    area_id_raw = event_data.get('area_id')
+    try:
+        area_id = int(area_id_raw) if area_id_raw is not None else None
+    except:
+        area_id = None
         
-        area_id_raw = event_data.get('area_id')
-        try:
-            area_id = int(area_id_raw) if area_id_raw is not None else None
-        except:
-            area_id = None
-            
-        message = event_data.get('message', '')
+    message = event_data.get('message', '')
+    
+    # JSON 직렬화 (실패 시 빈 객체)
+    try:
+        payload_json = json.dumps(event_data, ensure_ascii=False)
+    except:
+        payload_json = "{}"
+
+    # [Commit 21-fix] 이벤트 타입에 따라 테이블 분기
+    if event_type == 'PEOPLE_COUNT':
+        # [Commit 22-1] 품질 가드: Area ID 필수
+        if area_id is None:
+            return None
+
+        delta = event_data.get('delta')
+        # delta가 없으면 계산 시도 (fallback)
+        if delta is None:
+            prev = event_data.get('prev_value')
+            curr = event_data.get('count')
+            if prev is not None and curr is not None:
+                delta = curr - prev
         
-        # JSON 직렬화 (실패 시 빈 객체)
+        # delta > 0 인 경우에만 people_delta_events에 저장
+        if delta is not None and delta > 0:
+            return 'people', (ts, ts_epoch, camera_key, area_id, delta, payload_json)
+        return None
+
+    # 그 외 모든 이벤트는 event_logs에 저장
+    return 'log', (ts, ts_epoch, camera_key, event_type, area_id, message, payload_json)
+
+_SQL_INSERT_PEOPLE = 'INSERT INTO people_delta_events (ts, ts_epoch, camera_key, area_id, delta, payload_json) VALUES (?, ?, ?, ?, ?, ?)'
+_SQL_INSERT_LOG = 'INSERT INTO event_logs (ts, ts_epoch, camera_key, event_type, area_id, message, payload_json) VALUES (?, ?, ?, ?, ?, ?, ?)'
+
+def insert_events(events):
+    """이벤트 여러 건을 테이블별 executemany + 1회 commit으로 저장"""
+    people_rows = []
+    log_rows = []
+    for event_data in events:
         try:
-            payload_json = json.dumps(event_data, ensure_ascii=False)
-        except:
-            payload_json = "{}"
+            row = _build_event_row(event_data)
+        except Exception as e:
+            allow, suppressed = should_log("db_insert_error", 60)
+            if allow:
+                logger.error(f"[DB] Insert Error: {e}" + (f" (suppressed {suppressed})" if suppressed > 0 else ""))
+            continue
+        if row is None:
+            continue
+        (people_rows if row[0] == 'people' else log_rows).append(row[1])
 
+    if not people_rows and not log_rows:
+        return
+
+    try:
         with _connect_db() as conn:
-            # [Commit 21-fix] 이벤트 타입에 따라 테이블 분기
-            if event_type == 'PEOPLE_COUNT':
-                # [Commit 22-1] 품질 가드: Area ID 필수
-                if area_id is None:
-                    return
-
-                delta = event_data.get('delta')
-                # delta가 없으면 계산 시도 (fallback)
-                if delta is None:
-                    prev = event_data.get('prev_value')
-                    curr = event_data.get('count')
-                    if prev is not None and curr is not None:
-                        delta = curr - prev
-                
-                # delta > 0 인 경우에만 people_delta_events에 저장
-                if delta is not None and delta > 0:
-                    conn.execute('INSERT INTO people_delta_events (ts, ts_epoch, camera_key, area_id, delta, payload_json) VALUES (?, ?, ?, ?, ?, ?)', (ts, ts_epoch, camera_key, area_id, delta, payload_json))
-            else:
-                # 그 외 모든 이벤트는 event_logs에 저장
-                conn.execute('INSERT INTO event_logs (ts, ts_epoch, camera_key, event_type, area_id, message, payload_json) VALUES (?, ?, ?, ?, ?, ?, ?)', (ts, ts_epoch, camera_key, event_type, area_id, message, payload_json))
-            
+            if people_rows:
+                conn.executemany(_SQL_INSERT_PEOPLE, people_rows)
+            if log_rows:
+                conn.executemany(_SQL_INSERT_LOG, log_rows)
             conn.commit()
+        return
+    except Exception as e:
+        batch_error = e
+
+    # 묶음 기록 실패 시 1건씩 재시도 (문제 행만 버리고 나머지는 저장)
+    rows = [(_SQL_INSERT_PEOPLE, r) for r in people_rows] + [(_SQL_INSERT_LOG, r) for r in log_rows]
+    saved = 0
+    try:
+        with _connect_db() as conn:
+            for sql, row in rows:
+                try:
+                    conn.execute(sql, row)
+                    conn.commit()
+                    saved += 1
+                except Exception as e:
+                    conn.rollback()
+                    batch_error = e
     except Exception as e:
+        batch_error = e
+
+    dropped = len(rows) - saved
+    if dropped:
         allow, suppressed = should_log("db_insert_error", 60)
         if allow:
-            msg = f"[DB] Insert Error: {e}" + (f" (suppressed {suppressed})" if suppressed > 0 else "")
+            msg = f"[DB] Insert Error: {batch_error} (dropped {dropped}/{len(rows)} rows)" + (f" (suppressed {suppressed})" if suppressed > 0 else "")
             logger.error(msg)
 
+def insert_event(event_data):
+    """이벤트 데이터를 DB에 저장"""
+    insert_events([event_data])
+
 def get_recent_events(limit=200):
     """최근 이벤트 조회 (최신순)"""
     events = []
@@ -375,3 +450,94 @@ def get_people_count_stats_debug(camera_key, hours=None):
     except Exception as e:
         logger.error(f"[DB] Stats Debug Error: {e}")
     return stats, rows_scanned
+
+def _fetch_people_stats_rows(keys, periods):
+    """
+    카메라 x Area별 기간 집계 행을 1회 쿼리로 조회합니다.
+    Returns: [(camera_key, area_id, sum_p0, cnt_p0, sum_p1, cnt_p1, ...)]
+    """
+    # 기간별 SUM/COUNT 컬럼 (hours=None은 조건 없음)
+    now_epoch = int(time.time())
+    cols = []
+    params = []
+    for hours in periods:
+        if hours is None:
+            cols.append("SUM(delta), COUNT(*)")
+        else:
+            cols.append("SUM(CASE WHEN ts_epoch >= ? THEN delta ELSE 0 END), SUM(CASE WHEN ts_epoch >= ? THEN 1 ELSE 0 END)")
+            cutoff = now_epoch - (hours * 3600)
+            params += [cutoff, cutoff]
+    placeholders = ','.join('?' * len(keys))
+    query = (f"SELECT camera_key, area_id, {', '.join(cols)} FROM people_delta_events "
+             f"WHERE camera_key IN ({placeholders}) GROUP BY camera_key, area_id")
+    params += keys
+
+    with _connect_db() as conn:
+        return conn.execute(query, tuple(params)).fetchall()
+
+def _query_people_stats_multi(camera_keys, periods):
+    """
+    여러 카메라 x 여러 기간 집계를 1회 쿼리로 조회합니다.
+    Returns: {camera_key: {hours: ({area_id: sum_delta}, rows)}} (hours=None은 전체 기간)
+    """
+    keys = list(camera_keys)
+    result = {k: {h: ({}, 0) for h in periods} for k in keys}
+    if not keys:
+        return result
+
+    for row in _fetch_people_stats_rows(keys, periods):
+        by_period = result.get(row[0])
+        if by_period is None:
+            continue
+        try:
+            aid = int(row[1])
+        except (TypeError, ValueError):
+            continue
+        for i, hours in enumerate(periods):
+            val, cnt = row[2 + 2 * i], row[3 + 2 * i]
+            if not cnt:
+                continue # 해당 기간에 행 없음 (단일 조회와 동일하게 Area 미포함)
+            stats, rows = by_period[hours]
+            stats[aid] = int(val) if val is not None else 0
+            by_period[hours] = (stats, rows + int(cnt))
+    return result
+
+def get_people_count_grid_multi(camera_keys, periods=(1, 24, None), area_count=4):
+    """
+    표 표시용 집계 (1회 쿼리). 중간 dict 없이 기간 x Area(1~area_count) 고정 크기 격자로 반환합니다.
+    Returns: {camera_key: ((p0_area1, ..., p0_areaN), (p1_area1, ...), ...)} (값 없음은 0)
+    """
+    keys = list(camera_keys)
+    empty = ((0,) * area_count,) * len(periods)
+    if not keys:
+        return {}
+    try:
+        rows = _fetch_people_stats_rows(keys, periods)
+    except Exception as e:
+        logger.error(f"[DB] Stats Grid Error: {e}")
+        return {k: empty for k in keys}
+
+    grids = {}
+    for row in rows:
+        try:
+            col = int(row[1]) - 1
+        except (TypeError, ValueError):
+            continue
+        if not 0 <= col < area_count:
+            continue
+        grid = grids.get(row[0])
+        if grid is None:
+            grid = grids[row[0]] = [[0] * area_count for _ in periods]
+        for i in range(len(periods)):
+            val = row[2 + 2 * i]
+            if val is not None and row[3 + 2 * i]:
+                grid[i][col] = int(val)
+    return {k: tuple(map(tuple, grids[k])) if k in grids else empty for k in keys}
+
+def get_people_count_stats_debug_multi(camera_keys, periods=(1, 24, None)):
+    """디버그용 다중 집계 (1회 쿼리). Returns: {camera_key: {hours: ({area_id: count}, rows_scanned)}}"""
+    try:
+        return _query_people_stats_multi(camera_keys, periods)
+    except Exception as e:
+        logger.error(f"[DB] Stats Debug Multi Error: {e}")
+        return {k: {h: ({}, 0) for h in periods} for k in camera_keys}
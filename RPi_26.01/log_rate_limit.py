@@ -5,7 +5,7 @@ from collections import OrderedDict
 class LogRateLimiter:
     def __init__(self, max_keys=1000):
         self._lock = threading.Lock()
-        self._last_log_time = OrderedDict() # key: timestamp
+        self._last_log_time = OrderedDict() # key: time.monotonic_ns()
         self._suppressed_counts = {} # key: count
         self._max_keys = max_keys
 
@@ -14,11 +14,13 @@ class LogRateLimiter:
         키별로 로깅 허용 여부를 반환합니다.
         Returns: (allowed: bool, suppressed_count: int)
         """
+        # 정수(ns) 비교 + 단조 시계 (벽시계 보정 시에도 간격 유지)
+        interval_ns = int(interval_sec * 1_000_000_000)
+        now = time.monotonic_ns()
         with self._lock:
-            now = time.time()
-            last_time = self._last_log_time.get(key, 0)
+            last_time = self._last_log_time.get(key)
             
-            if now - last_time < interval_sec:
+            if last_time is not None and now - last_time < interval_ns:
                 self._suppressed_counts[key] = self._suppressed_counts.get(key, 0) + 1
                 return False, 0
             
@@ -39,3 +41,65 @@ _limiter = LogRateLimiter()
 def should_log(key, interval_sec=60):
     """전역 레이트 리미터 헬퍼 함수"""
     return _limiter.should_log(key, interval_sec)
+
+
+class TokenBucket:
+    """
+    키 1개의 토큰 버킷. (rate: 초당 충전 토큰 수, burst: 최대 토큰 수)
+    순간 폭주(burst)는 허용하되 장기 평균 속도는 rate로 제한합니다.
+    """
+    __slots__ = ('tokens', 'rate', 'burst', 'last', 'suppressed')
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last = time.monotonic()
+        self.suppressed = 0
+
+    def check(self):
+        """
+        토큰 1개를 소비해 허용 여부를 반환합니다.
+        Returns: (allowed: bool, suppressed_count: int)
+        """
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            suppressed = self.suppressed
+            self.suppressed = 0
+            return True, suppressed
+        self.suppressed += 1
+        return False, 0
+
+
+class TokenBucketLimiter:
+    def __init__(self, max_keys=1000):
+        self._lock = threading.Lock()
+        self._buckets = OrderedDict() # key: TokenBucket
+        self._max_keys = max_keys
+
+    def allow(self, key, rate, burst):
+        """
+        키별 토큰 버킷으로 로깅 허용 여부를 반환합니다.
+        Returns: (allowed: bool, suppressed_count: int)
+        """
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(rate, burst)
+                self._buckets[key] = bucket
+                # 키가 너무 많으면 오래된 것 삭제 (메모리 누수 방지)
+                if len(self._buckets) > self._max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key) # LRU 갱신
+            return bucket.check()
+
+# 전역 인스턴스
+_bucket_limiter = TokenBucketLimiter()
+
+def allow_burst(key, rate, burst):
+    """전역 토큰 버킷 헬퍼 함수 (rate: 초당 허용 수, burst: 순간 허용 수)"""
+    return _bucket_limiter.allow(key, rate, burst)
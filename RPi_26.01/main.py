@@ -32,6 +32,10 @@ def main():
     # Segfault 디버깅을 위한 핸들러 활성화
     faulthandler.enable()
     
+    # 불투명 형제 위젯 영역 차감(repaint마다 형제 간 교차 검사) 생략 - QApplication 생성 전에 설정해야 함
+    # 겹치는 형제는 아래 위젯을 먼저 그린 뒤 덮어 그리므로 결과는 동일 (그리기 양만 약간 증가)
+    os.environ.setdefault('QT_NO_SUBTRACTOPAQUESIBLINGS', '1')
+
     # QApplication 인스턴스 생성
     app = QApplication(sys.argv)
     
@@ -96,7 +96,7 @@ a = Analysis(
     datas=datas,
     hiddenimports=hiddenimports + [
         "window_main","window_ui","video_ui","cgi_client","db_module",
-        "config_module","gpio_bridge","state_manager","log","log_rate_limit","app_paths"
+        "config_module","gpio_bridge","state_manager","log","log_rate_limit","app_paths","sys_stat"
     ],
     hookspath=[str(SPEC_DIR)],
     hooksconfig={},
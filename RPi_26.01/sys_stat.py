@@ -0,0 +1,65 @@
+import threading
+from PySide6.QtCore import QObject, Signal
+from log import get_logger
+
+logger = get_logger(__name__)
+
+# psutil은 네이티브 라이브러리 로딩 비용이 있어 첫 사용 시점에 import
+_psutil = None # None: 미확인, False: 미설치
+
+
+def get_psutil():
+    """psutil 모듈을 지연 import 하여 반환합니다. (미설치 시 None)"""
+    global _psutil
+    if _psutil is None:
+        try:
+            import psutil
+            _psutil = psutil
+        except ImportError:
+            _psutil = False
+    return _psutil or None
+
+
+class SysStatSampler(QObject):
+    """
+    CPU/MEM 사용률을 백그라운드 스레드에서 주기적으로 샘플링합니다.
+    GUI 스레드에서는 stats_updated 시그널로 받은 값만 표시합니다.
+    """
+    stats_updated = Signal(float, float) # (cpu%, mem%)
+
+    def __init__(self, interval_sec=1.0):
+        super().__init__()
+        self._interval = interval_sec
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """샘플링 스레드 시작 (psutil 미설치 시 False)"""
+        psutil = get_psutil()
+        if psutil is None:
+            return False
+        if self._thread and self._thread.is_alive():
+            return True
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, args=(psutil,), daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        self._stop_event.set()
+
+    def _run(self, psutil):
+        # 첫 호출은 기준점 설정용 (interval=None은 직전 호출 이후 구간의 사용률)
+        try:
+            psutil.cpu_percent()
+        except Exception:
+            pass
+        # Event.wait로 대기하여 stop 시 즉시 종료
+        while not self._stop_event.wait(self._interval):
+            try:
+                cpu = psutil.cpu_percent()
+                mem = psutil.virtual_memory().percent
+            except Exception as e:
+                logger.debug(f"[SysStat] sample failed: {e}")
+                continue
+            self.stats_updated.emit(cpu, mem)
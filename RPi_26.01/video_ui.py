@@ -1,6 +1,7 @@
 import os
 import sys
 import re
+from array import array
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 
 from PySide6.QtWidgets import QWidget, QLabel, QFrame, QStackedLayout, QApplication, QSizePolicy
@@ -48,6 +49,22 @@ def _roi_diag_enabled() -> bool:
     return os.environ.get("OPAS_ROI_DIAG", "").lower() in ("1","true","yes","on")
 
 
+# ROI 정규화 좌표(0.0~1.0) 양자화 스케일 (uint16 고정소수점)
+# 1080p 기준 1px ≈ 5e-4 이므로 1/65535 정밀도면 충분
+_ROI_Q_SCALE = 65535
+_ROI_Q_INV = 1.0 / _ROI_Q_SCALE
+
+
+def _quantize_norm(v: float) -> int:
+    """정규화 좌표를 uint16 고정소수점으로 변환 (범위 밖 값은 clamp)"""
+    q = int(v * _ROI_Q_SCALE + 0.5)
+    if q < 0:
+        return 0
+    if q > _ROI_Q_SCALE:
+        return _ROI_Q_SCALE
+    return q
+
+
 def _env_int(name: str, default: int) -> int:
     v = os.environ.get(name, "").strip()
     if not v:
@@ -168,6 +185,7 @@ class VideoWidget(QWidget):
     update_label_signal = Signal(str)
     clicked = Signal(str) # camera_key
     doubleClicked = Signal(str) # camera_key
+    playing_changed = Signal(str, bool) # camera_key, 파이프라인 PLAYING 여부 (변경 시에만 발생)
 
     # [STEP 2] GStreamer 스레드 -> GUI 스레드로 프레임을 안전하게 전달하기 위한 시그널
     frame_ready = Signal(object)
@@ -197,6 +215,7 @@ class VideoWidget(QWidget):
 
         self._pipeline = None
         self._bus = None
+        self._playing = False # 마지막으로 관측된 PLAYING 상태 (bus STATE_CHANGED / 정지 시 갱신)
 
         self._src_width = 0
         self._src_height = 0
@@ -207,10 +226,14 @@ class VideoWidget(QWidget):
         self._sink = None
         self._win_id = None
         self._appsink = None # Qt Overlay 모드용
+        self._last_render_rect = (0, 0) # 마지막 set_render_rectangle (w, h) 캐시
 
         # ROI
         # Data structure: { area_id (int): [(x_norm, y_norm), ...] }
         self.roi_regions_norm = {} 
+        # 그리기 전용 SoA 캐시: { area_id: array('H') } (x/y 좌표를 uint16 양자화 배열로 분리)
+        self._roi_xs = {}
+        self._roi_ys = {}
         self.roi_enabled_areas = set()
         self.roi_edit_area = None
         self.roi_edit_mode = False
@@ -223,6 +246,7 @@ class VideoWidget(QWidget):
         self.last_draw_h = 0.0
         self._draw_calls = 0
         self._draw_errors = 0
+        self._ctx_is_native = None # cairooverlay context가 pycairo 네이티브인지 (최초 draw 시 판별)
         # roi_display_mode 제거: window_main에서 set_roi_regions로 데이터 자체를 제어함
 
         # reconnect
@@ -238,6 +262,13 @@ class VideoWidget(QWidget):
         self.bus_timer.setInterval(50)  # 20fps 정도로 메시지 폴링
         self.bus_timer.timeout.connect(self._poll_bus)
 
+        # ROI 오버레이 갱신 합치기 (Qt Overlay 모드, 최대 40Hz)
+        # 드래그/설정 변경이 연속으로 들어와도 25ms 내 요청은 1회 repaint로 처리
+        self._roi_redraw_timer = QTimer(self)
+        self._roi_redraw_timer.setSingleShot(True)
+        self._roi_redraw_timer.setInterval(25)
+        self._roi_redraw_timer.timeout.connect(self._on_roi_redraw_timeout)
+
         # UI 구성
         if self.use_qt_overlay:
             # Qt 렌더링용 커스텀 라벨
@@ -405,11 +436,12 @@ class VideoWidget(QWidget):
                 ny = max(0.0, min(1.0, ny))
                 
                 self.roi_regions_norm[self.roi_edit_area][self.roi_active_point_index] = (float(nx), float(ny))
+                self._roi_xs[self.roi_edit_area][self.roi_active_point_index] = _quantize_norm(nx)
+                self._roi_ys[self.roi_edit_area][self.roi_active_point_index] = _quantize_norm(ny)
                 # GStreamer overlay updates automatically on next frame
 
                 # Qt Overlay 모드일 경우 수동 갱신 요청
-                if self.use_qt_overlay:
-                    self.video_area.update()
+                self._request_roi_redraw()
 
     def mouseReleaseEvent(self, event):
         if not self.roi_edit_mode:
@@ -517,6 +549,8 @@ class VideoWidget(QWidget):
                 self._pipeline.get_state(2 * Gst.SECOND)
             except Exception:
                 pass
+        # bus 폴링이 멈추므로 NULL 전환 메시지 대신 직접 반영
+        self._set_playing(False)
 
     def safe_shutdown(self):
         """
@@ -538,11 +572,17 @@ class VideoWidget(QWidget):
                 self._sink = None
         except Exception as e:
             logger.error(f"[VideoWidget] safe_shutdown error: {e}")
+        self._set_playing(False)
 
     def release(self):
         # 파이프라인/버스 레퍼런스 정리
         self.safe_shutdown()
 
+    def _set_playing(self, playing):
+        if playing != self._playing:
+            self._playing = playing
+            self.playing_changed.emit(self.camera_key, playing)
+
     def is_playing(self):
         if self._pipeline:
             _, state, _ = self._pipeline.get_state(0)
@@ -551,6 +591,30 @@ class VideoWidget(QWidget):
 
     def set_roi_regions(self, norm_by_area: dict, enabled_by_area: set):
         """ROI 전체 데이터를 설정합니다."""
+        # Qt Overlay 모드일 경우 갱신 요청 (양자화 좌표/활성 영역이 동일하면 생략)
+        if self._store_roi_regions(norm_by_area, enabled_by_area):
+            self._request_roi_redraw()
+
+    def apply_roi_state(self, norm_by_area: dict, enabled_by_area: set, visible: bool = True,
+                        edit_area: int | None = None, edit_mode: bool = False):
+        """ROI 데이터/표시/편집 상태를 한 번에 설정합니다. (변경이 있을 때만 repaint 1회 예약)"""
+        changed = self._store_roi_regions(norm_by_area, enabled_by_area)
+        if visible != self.roi_visible:
+            self.roi_visible = visible
+            changed = True
+        if edit_area != self.roi_edit_area or edit_mode != self.roi_edit_mode:
+            self.roi_edit_area = edit_area
+            self.roi_edit_mode = edit_mode
+            self.roi_active_point_index = -1
+            changed = True
+        if changed:
+            self._request_roi_redraw()
+
+    def _store_roi_regions(self, norm_by_area: dict, enabled_by_area: set) -> bool:
+        """
+        ROI 데이터를 저장하고 그리기 캐시를 갱신합니다.
+        Returns: 화면에 보이는 내용(양자화 좌표/활성 영역)이 달라졌는지 여부
+        """
         # 데이터 복사하여 저장 (외부 참조 방지)
         # 키를 int로 강제 변환하여 저장 (문자열 키 문제 방지)
         self.roi_regions_norm = {}
@@ -560,7 +624,9 @@ class VideoWidget(QWidget):
                     self.roi_regions_norm[int(k)] = list(v)
                 except ValueError:
                     pass
+        geometry_changed = self._rebuild_roi_soa()
         
+        prev_enabled = self.roi_enabled_areas
         self.roi_enabled_areas = set()
         if enabled_by_area:
             self.roi_enabled_areas = {int(k) for k in enabled_by_area if str(k).isdigit()}
@@ -571,10 +637,20 @@ class VideoWidget(QWidget):
         
         if _roi_diag_enabled():
             logger.warning(f"[ROI-DIAG][{self.camera_key}] set_roi_regions regions={len(self.roi_regions_norm)} enabled={len(self.roi_enabled_areas)} keys={sorted(self.roi_regions_norm.keys())}")
-            
-        # Qt Overlay 모드일 경우 즉시 갱신
-        if self.use_qt_overlay:
-            self.video_area.update()
+
+        return geometry_changed or prev_enabled != self.roi_enabled_areas
+
+    def _rebuild_roi_soa(self) -> bool:
+        """
+        roi_regions_norm으로부터 그리기용 x/y uint16 배열을 재구성합니다.
+        Returns: 이전 배열과 내용이 달라졌는지 여부
+        """
+        xs = {aid: array('H', [_quantize_norm(p[0]) for p in pts]) for aid, pts in self.roi_regions_norm.items()}
+        ys = {aid: array('H', [_quantize_norm(p[1]) for p in pts]) for aid, pts in self.roi_regions_norm.items()}
+        changed = xs != self._roi_xs or ys != self._roi_ys
+        self._roi_xs = xs
+        self._roi_ys = ys
+        return changed
 
     def set_roi_edit(self, area_id: int | None, edit_mode: bool):
         """편집 모드 및 대상 영역 설정"""
@@ -582,11 +658,10 @@ class VideoWidget(QWidget):
         self.roi_edit_mode = edit_mode
         self.roi_active_point_index = -1
 
-        if self.use_qt_overlay:
-            self.video_area.update()
+        self._request_roi_redraw()
 
     def get_roi_edit_points_norm(self):
-        """현재 편집 중인 영역의 좌표 반환"""
+        """현재 편집 중인 영역의 좌표 반환 (호출마다 새 리스트, 호출측에서 그대로 보관 가능)"""
         if self.roi_edit_area in self.roi_regions_norm:
             return list(self.roi_regions_norm[self.roi_edit_area])
         return []
@@ -599,8 +674,17 @@ class VideoWidget(QWidget):
 
     def set_roi_visible(self, visible: bool):
         self.roi_visible = visible
-        if self.use_qt_overlay:
-            self.video_area.update()
+        self._request_roi_redraw()
+
+    def _request_roi_redraw(self):
+        """Qt Overlay 모드에서 ROI repaint를 예약합니다. (25ms 단위로 합침)"""
+        if not self.use_qt_overlay:
+            return # cairooverlay는 다음 프레임에서 자동 반영
+        if not self._roi_redraw_timer.isActive():
+            self._roi_redraw_timer.start()
+
+    def _on_roi_redraw_timeout(self):
+        self.video_area.update()
 
     def set_highlight(self, active: bool):
         pass
@@ -1077,120 +1161,147 @@ class VideoWidget(QWidget):
                 buf.unmap(map_info)
         return Gst.FlowReturn.OK
 
+    def _wrap_cairo_context(self, ctx):
+        """
+        cairooverlay가 넘겨준 context를 pycairo.Context로 변환한다.
+        변환할 수 없으면 None을 반환한다.
+        """
+        # This path is likely taken in the onefile environment where the context
+        # is a GBoxed object from GI, not a direct pycairo.Context.
+        if _roi_diag_enabled() and self._draw_calls <= 3:
+            logger.warning(f"[ROI-DIAG] Context is not a pycairo.Context. Type: {type(ctx)}")
+            logger.warning(f"[ROI-DIAG] Attempting to wrap from native pointer...")
+            # [STEP 6-1] Enhanced pointer search
+            logger.warning(f"[ROI-DIAG] Context MRO: {ctx.__class__.__mro__}")
+            
+            candidates = [
+                "__gpointer__", "get_pointer", "get_target", "cairo_t", "ptr", "pointer",
+                "__gtype__", "gtype", "type", "get_type",
+                "to_pointer", "get_address", "address", "__int__", "__index__",
+                "get_boxed", "boxed", "_boxed", "_obj", "_pointer", "_pyobject"
+            ]
+            
+            for name in candidates:
+                if hasattr(ctx, name):
+                    try:
+                        attr_val = getattr(ctx, name)
+                        if callable(attr_val): attr_val = attr_val()
+                        logger.warning(f"[ROI-DIAG] context has attr {name}={attr_val!r}")
+                    except Exception as e_attr:
+                        logger.warning(f"[ROI-DIAG] failed to get attr {name}: {e_attr!r}")
+            
+            # Check repr for address
+            try:
+                repr_str = repr(ctx)
+                match = re.search(r"at (0x[0-9a-fA-F]+)", repr_str)
+                if match:
+                    logger.warning(f"[ROI-DIAG] Found address in repr: {match.group(1)}")
+            except Exception:
+                pass
+
+        # STEP 5-2: Attempt to wrap using the pointer
+        if not (HAS_PYCAIRO and hasattr(ctx, "__gpointer__")):
+            if _roi_diag_enabled():
+                logger.warning(f"[ROI-DIAG] Cannot wrap context: pycairo not loaded or context has no __gpointer__.")
+            return None
+        try:
+            return cairo.Context.from_address(int(ctx.__gpointer__))
+        except Exception as e:
+            if _roi_diag_enabled():
+                logger.warning(f"[ROI-DIAG] Failed to wrap context from __gpointer__: {e!r}", exc_info=True)
+            return None
+
     def _on_draw_overlay(self, overlay, context, timestamp, duration):
         if not self.roi_visible:
             return
             
         # Draw 콜백 내 로그 출력 완전 제거 (성능/도배 방지)
+        self._draw_calls += 1
 
+        # [STEP 5] onefile cairo context wrapping
+        # context 타입은 프로세스 내에서 바뀌지 않으므로 최초 1회만 판별
+        if self._ctx_is_native is None:
+            self._ctx_is_native = hasattr(context, "set_line_width")
+
+        ctx = context
+        if not self._ctx_is_native:
+            ctx = self._wrap_cairo_context(context)
+            if ctx is None:
+                return # Cannot draw
+
+        # 1. Get Dimensions
+        draw_w, draw_h = 0.0, 0.0
         try:
-            self._draw_calls = getattr(self, "_draw_calls", 0) + 1
-
-            # [STEP 5] onefile cairo context wrapping
-            ctx = context
-            is_native_pycairo = hasattr(ctx, "set_line_width")
-
-            if not is_native_pycairo:
-                # This path is likely taken in the onefile environment where the context
-                # is a GBoxed object from GI, not a direct pycairo.Context.
-                if _roi_diag_enabled() and self._draw_calls <= 3:
-                    logger.warning(f"[ROI-DIAG] Context is not a pycairo.Context. Type: {type(ctx)}")
-                    logger.warning(f"[ROI-DIAG] Attempting to wrap from native pointer...")
-                    # [STEP 6-1] Enhanced pointer search
-                    logger.warning(f"[ROI-DIAG] Context MRO: {ctx.__class__.__mro__}")
-                    
-                    candidates = [
-                        "__gpointer__", "get_pointer", "get_target", "cairo_t", "ptr", "pointer",
-                        "__gtype__", "gtype", "type", "get_type",
-                        "to_pointer", "get_address", "address", "__int__", "__index__",
-                        "get_boxed", "boxed", "_boxed", "_obj", "_pointer", "_pyobject"
-                    ]
-                    
-                    for name in candidates:
-                        if hasattr(ctx, name):
-                            try:
-                                attr_val = getattr(ctx, name)
-                                if callable(attr_val): attr_val = attr_val()
-                                logger.warning(f"[ROI-DIAG] context has attr {name}={attr_val!r}")
-                            except Exception as e_attr:
-                                logger.warning(f"[ROI-DIAG] failed to get attr {name}: {e_attr!r}")
-                    
-                    # Check repr for address
-                    try:
-                        repr_str = repr(ctx)
-                        match = re.search(r"at (0x[0-9a-fA-F]+)", repr_str)
-                        if match:
-                            logger.warning(f"[ROI-DIAG] Found address in repr: {match.group(1)}")
-                    except Exception:
-                        pass
-
-                # STEP 5-2: Attempt to wrap using the pointer
-                if HAS_PYCAIRO and hasattr(ctx, "__gpointer__"):
-                    try:
-                        ptr = int(ctx.__gpointer__)
-                        ctx = cairo.Context.from_address(ptr)
-                    except Exception as e:
-                        if _roi_diag_enabled():
-                            logger.warning(f"[ROI-DIAG] Failed to wrap context from __gpointer__: {e!r}", exc_info=True)
-                        return # Cannot draw
-                else:
-                    if _roi_diag_enabled():
-                        logger.warning(f"[ROI-DIAG] Cannot wrap context: pycairo not loaded or context has no __gpointer__.")
-                    return # Cannot draw
-
-            # 1. Get Dimensions
-            draw_w, draw_h = 0.0, 0.0
-            try:
-                target = ctx.get_target()
-                draw_w = float(target.get_width())
-                draw_h = float(target.get_height())
-            except Exception:
-                pass
-            
-            if draw_w <= 0 or draw_h <= 0:
-                draw_w = float(self._src_width)
-                draw_h = float(self._src_height)
-            
-            if draw_w <= 0 or draw_h <= 0: return
-            
-            self.last_draw_w = draw_w
-            self.last_draw_h = draw_h
+            target = ctx.get_target()
+            draw_w = float(target.get_width())
+            draw_h = float(target.get_height())
+        except Exception:
+            pass
+        
+        if draw_w <= 0 or draw_h <= 0:
+            draw_w = float(self._src_width)
+            draw_h = float(self._src_height)
+        
+        if draw_w <= 0 or draw_h <= 0: return
+        
+        self.last_draw_w = draw_w
+        self.last_draw_h = draw_h
+
+        # 표시할 영역도 없고 편집 중도 아니면 cairo 상태 설정 없이 종료 (일반 모니터링 상황)
+        if not self.roi_enabled_areas and not self.roi_edit_mode:
+            return
+
+        # uint16 양자화 좌표 -> 픽셀 스케일
+        sx = draw_w * _ROI_Q_INV
+        sy = draw_h * _ROI_Q_INV
 
+        # cairo 호출만 예외 처리 (전처리/가드는 try 밖에서 수행)
+        try:
             # 2. Draw All Enabled Regions (Green Lines)
             ctx.set_line_width(2.0)
             ctx.set_source_rgba(0.0, 1.0, 0.0, 1.0) 
 
-            for area_id, points in self.roi_regions_norm.items():
+            # 모든 영역을 하나의 path(sub-path 여러 개)로 쌓고 stroke는 1회만 수행
+            has_path = False
+            for area_id, xs in self._roi_xs.items():
                 if area_id not in self.roi_enabled_areas: continue
-                if len(points) < 2: continue
+                if len(xs) < 2: continue
                 
-                px_pts = [(p[0] * draw_w, p[1] * draw_h) for p in points]
-                ctx.move_to(px_pts[0][0], px_pts[0][1])
-                for i in range(1, len(px_pts)):
-                    ctx.line_to(px_pts[i][0], px_pts[i][1])
+                px = [x * sx for x in xs]
+                py = [y * sy for y in self._roi_ys[area_id]]
+                ctx.move_to(px[0], py[0])
+                for x, y in zip(px[1:], py[1:]):
+                    ctx.line_to(x, y)
                 ctx.close_path()
+                has_path = True
+            if has_path:
                 ctx.stroke()
 
             # 3. Draw Handles for Editing Area (Yellow Circles)
             if self.roi_edit_mode and self.roi_edit_area is not None and self.roi_edit_area in self.roi_regions_norm:
-                ctx.set_source_rgba(1.0, 1.0, 0.0, 1.0) # Yellow
                 radius = 5.0 # pixel radius
+                active_idx = self.roi_active_point_index
                 
-                points = self.roi_regions_norm.get(self.roi_edit_area, [])
-                px_pts = [(p[0] * draw_w, p[1] * draw_h) for p in points]
+                xs = self._roi_xs.get(self.roi_edit_area, ())
+                ys = self._roi_ys.get(self.roi_edit_area, ())
                 
-                for i, (px, py) in enumerate(px_pts):
-                    # Active point highlight
-                    if i == self.roi_active_point_index:
-                        ctx.set_source_rgba(1.0, 0.0, 0.0, 1.0) # Red
-                    else:
-                        ctx.set_source_rgba(1.0, 1.0, 0.0, 1.0) # Yellow
-                        
-                    ctx.arc(px, py, radius, 0, 2 * 3.14159)
+                # 비활성 핸들: 노란색 1회 설정 후 한 번에 fill
+                ctx.set_source_rgba(1.0, 1.0, 0.0, 1.0) # Yellow
+                for i, (nx, ny) in enumerate(zip(xs, ys)):
+                    if i == active_idx: continue
+                    ctx.new_sub_path()
+                    ctx.arc(nx * sx, ny * sy, radius, 0, 2 * 3.14159)
+                ctx.fill()
+
+                # 활성 핸들: 빨간색으로 마지막에 그림
+                if 0 <= active_idx < len(xs):
+                    ctx.set_source_rgba(1.0, 0.0, 0.0, 1.0) # Red
+                    ctx.new_sub_path()
+                    ctx.arc(xs[active_idx] * sx, ys[active_idx] * sy, radius, 0, 2 * 3.14159)
                     ctx.fill()
                     
         except Exception:
-            self._draw_errors = getattr(self, "_draw_errors", 0) + 1
+            self._draw_errors += 1
             if _roi_diag_enabled():
                 logger.warning(
                     f"[ROI-DIAG] draw exception calls={self._draw_calls} "
@@ -1203,7 +1314,7 @@ class VideoWidget(QWidget):
         if _roi_diag_enabled() and self._draw_calls % 100 == 0:
             logger.warning(
                 f"[ROI-DIAG] draw OK calls={self._draw_calls} "
-                f"errors={getattr(self,'_draw_errors',0)}"
+                f"errors={self._draw_errors}"
             )
 
     def _draw_roi_qt(self, painter: QPainter, draw_rect: QRectF):
@@ -1218,9 +1329,12 @@ class VideoWidget(QWidget):
 
         if not self.roi_visible:
             return
+        if not self.roi_enabled_areas and not self.roi_edit_mode:
+            return
 
-        draw_w = draw_rect.width()
-        draw_h = draw_rect.height()
+        # uint16 양자화 좌표 -> 픽셀 스케일
+        sx = draw_rect.width() * _ROI_Q_INV
+        sy = draw_rect.height() * _ROI_Q_INV
         offset_x = draw_rect.x()
         offset_y = draw_rect.y()
 
@@ -1228,15 +1342,12 @@ class VideoWidget(QWidget):
         pen = QPen(QColor(0, 255, 0), 2)
         painter.setPen(pen)
         
-        for area_id, points in self.roi_regions_norm.items():
+        for area_id, xs in self._roi_xs.items():
             if area_id not in self.roi_enabled_areas: continue
-            if len(points) < 2: continue
+            if len(xs) < 2: continue
             
-            poly_points = []
-            for nx, ny in points:
-                px = offset_x + nx * draw_w
-                py = offset_y + ny * draw_h
-                poly_points.append(QPointF(px, py))
+            ys = self._roi_ys[area_id]
+            poly_points = [QPointF(offset_x + nx * sx, offset_y + ny * sy) for nx, ny in zip(xs, ys)]
             
             painter.drawPolygon(QPolygonF(poly_points))
 
@@ -1250,21 +1361,22 @@ class VideoWidget(QWidget):
             pen_red = QPen(QColor(255, 0, 0), 2)
             brush_red = QBrush(QColor(255, 0, 0))
             
-            points = self.roi_regions_norm.get(self.roi_edit_area, [])
+            xs = self._roi_xs.get(self.roi_edit_area, ())
+            ys = self._roi_ys.get(self.roi_edit_area, ())
             radius = 5.0
+            active_idx = self.roi_active_point_index
             
-            for i, (nx, ny) in enumerate(points):
-                px = offset_x + nx * draw_w
-                py = offset_y + ny * draw_h
-                
-                if i == self.roi_active_point_index:
-                    painter.setPen(pen_red)
-                    painter.setBrush(brush_red)
-                else:
-                    painter.setPen(pen_yellow)
-                    painter.setBrush(brush_yellow)
-                
-                painter.drawEllipse(QPointF(px, py), radius, radius)
+            # 비활성 핸들은 pen/brush 1회 설정 후 일괄 그리기
+            painter.setPen(pen_yellow)
+            painter.setBrush(brush_yellow)
+            for i, (nx, ny) in enumerate(zip(xs, ys)):
+                if i == active_idx: continue
+                painter.drawEllipse(QPointF(offset_x + nx * sx, offset_y + ny * sy), radius, radius)
+
+            if 0 <= active_idx < len(xs):
+                painter.setPen(pen_red)
+                painter.setBrush(brush_red)
+                painter.drawEllipse(QPointF(offset_x + xs[active_idx] * sx, offset_y + ys[active_idx] * sy), radius, radius)
 
     # -----------------------
     # Bus polling (Qt timer)
@@ -1279,6 +1391,7 @@ class VideoWidget(QWidget):
                 Gst.MessageType.ERROR
                 | Gst.MessageType.EOS
                 | Gst.MessageType.STATE_CHANGED
+                | Gst.MessageType.LATENCY
             )
             if not msg:
                 break
@@ -1294,13 +1407,23 @@ class VideoWidget(QWidget):
                 self._schedule_reconnect("Bus Error")
 
             elif t == Gst.MessageType.EOS:
-                logger.warning(f"[VideoWidget][{self.camera_key}] EOS")
+                allow, suppressed = should_log(f"gst_eos_{self.camera_key}", 60)
+                if allow:
+                    logger.warning(f"[VideoWidget][{self.camera_key}] EOS" + (f" (suppressed {suppressed})" if suppressed > 0 else ""))
                 self.update_label_signal.emit("EOS")
                 self._schedule_reconnect("EOS")
 
+            elif t == Gst.MessageType.LATENCY:
+                # 하위 요소(rtspsrc/decoder)의 latency 변경 시 재분배 (재연결 없이 처리)
+                if not self._pipeline.recalculate_latency():
+                    allow, suppressed = should_log(f"gst_latency_{self.camera_key}", 60)
+                    if allow:
+                        logger.warning(f"[VideoWidget][{self.camera_key}] recalculate_latency failed" + (f" (suppressed {suppressed})" if suppressed > 0 else ""))
+
             elif t == Gst.MessageType.STATE_CHANGED:
                 if msg.src == self._pipeline:
                     old, new, pending = msg.parse_state_changed()
+                    self._set_playing(new == Gst.State.PLAYING)
                     if new == Gst.State.PLAYING:
                         # 재생 성공 시 백오프 리셋
                         if self.retry_count > 0:
@@ -1324,15 +1447,21 @@ class VideoWidget(QWidget):
             # print(f"[VideoWidget][{self.camera_key}] set_window_handle called with {self._win_id}")
         except Exception:
             pass
+        # 핸들이 재설정되면 sink의 render rect도 다시 적용해야 하므로 캐시 무효화
+        self._last_render_rect = (0, 0)
 
     def _apply_render_rect(self):
         if self.use_qt_overlay:
             return
         if not self._sink or not self._win_id:
             return
+        w = self.video_area.width()
+        h = self.video_area.height()
+        # 동일 크기의 resize 이벤트가 반복되므로 변경이 없으면 sink 호출 생략
+        if (w, h) == self._last_render_rect:
+            return
+        self._last_render_rect = (w, h)
         try:
-            w = self.video_area.width()
-            h = self.video_area.height()
             GstVideo.VideoOverlay.set_render_rectangle(self._sink, 0, 0, w, h)
         except Exception:
             pass
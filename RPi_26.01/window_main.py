@@ -1,12 +1,13 @@
-from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QStackedLayout,
+from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout,
                                QLabel, QListWidgetItem, QFrame, QMessageBox, QApplication)
-from PySide6.QtCore import Qt, Slot, QTimer, QSize, Signal, QThreadPool, QRunnable, QObject, QEvent
-from PySide6.QtGui import QFont, QPixmap
+from PySide6.QtCore import Qt, Slot, QTimer, QSize, Signal, QThreadPool, QRunnable, QObject, QEvent, QMetaObject, Q_ARG
+from PySide6.QtGui import QFont, QPixmap, QTextCursor
 from config_module import ConfigManager
 from state_manager import StateManager
 from video_ui import VideoWidget
 from cgi_client import build_rtsp_url, PeopleCountThread, StayDetectionThread, fetch_region_data, parse_region_count
 from gpio_bridge import GpioBridge
+from sys_stat import SysStatSampler
 import db_module
 import cgi_client
 try:
@@ -14,95 +15,167 @@ try:
 except ImportError:
     # 패키지 형태로 실행될 경우를 대비한 상대 경로 임포트
     from .window_ui import WindowUI, CameraListItem
-import copy
 from log import get_logger, cleanup_old_logs, check_and_rotate_log
-from log_rate_limit import should_log
+from log_rate_limit import should_log, allow_burst
 import time
 import re
-import hashlib
-import socket
-
-try:
-    import psutil
-    HAS_PSUTIL = True
-except ImportError:
-    HAS_PSUTIL = False
+import logging
+from concurrent.futures import ThreadPoolExecutor
 
 logger = get_logger(__name__)
 
+# 그리드 스트레치 초기화 범위 (최대 2x2 분할, 여유 포함)
+_STRETCH_CLEAR_RANGE = 4
+
+# Idle 감지 대상 사용자 입력 이벤트 (MouseMove 제외 - 노이즈 방지)
+_USER_ACTIVITY_EVENTS = frozenset((QEvent.Type.MouseButtonPress, QEvent.Type.KeyPress, QEvent.Type.Wheel))
+
+# GUI_LOG rate-limit 키 생성용 (카메라 식별, 숫자 -> # 템플릿화)
+_RE_LOG_CAMERA = re.compile(r'(?:camera[=\s]|\[)(camera\d+)')
+_LOG_DIGIT_TABLE = str.maketrans('0123456789', '##########')
+# 1초 창 내 DEBUG 로그가 이 건수 미만이면 템플릿/해시 없이 바로 기록
+_GUI_DEBUG_FAST_LIMIT = 20
+_GUI_DEBUG_WINDOW_NS = 1_000_000_000
+
+# 복구 로그 토큰 버킷 (장기 5분당 1건, 연속 장애 초기 3건은 즉시 기록)
+_HEALTH_LOG_RATE = 1 / 300
+_HEALTH_LOG_BURST = 3
+
+# 모니터링 표 스타일 (1121 스타일: monitoring_manager.py / config_module.py get_css_classes 참조)
+_TABLE_STYLE = """
+<style>
+.table-header { 
+    border: 1px solid #cccccc; padding: 2px 4px; text-align: center; 
+    font-weight: 600; background-color: #f0f0f0; color: #333333; font-size: 11px;
+}
+.table-cell-left { 
+    border: 1px solid #cccccc; padding: 2px 4px; text-align: left; 
+    font-weight: 500; color: #333333; background-color: white; font-size: 11px;
+}
+.table-cell-center { 
+    border: 1px solid #cccccc; padding: 2px 4px; text-align: center; 
+    font-weight: 500; color: #333333; background-color: white; font-size: 11px;
+}
+</style>
+"""
+_TABLE_OPEN = '<table width="100%" cellspacing="0" cellpadding="0" style="border-collapse: collapse;">'
+# 집계 표 머리: 카메라 정보 + Area 1~4 (총 5열)
+_SUM_TABLE_HEAD = (_TABLE_STYLE + _TABLE_OPEN
+    + '<tr><th class="table-header" style="width:300px;">카메라 정보</th>'
+    + ''.join(f'<th class="table-header">Area {i+1}</th>' for i in range(4)) + '</tr>')
+# 실시간 표 머리: Area 1~4 (총 4열) - 1121 Realtime 표는 카메라 정보 헤더가 없음
+_RT_TABLE_HEAD = (_TABLE_STYLE + _TABLE_OPEN
+    + '<tr>' + ''.join(f'<th class="table-header" style="width:90px;">Area {i+1}</th>' for i in range(4)) + '</tr>')
+# 모니터링 표 값 셀 템플릿
+_TABLE_CELL_CENTER = '<td class="table-cell-center">{}</td>'
+# 집계 표 기간 행 (라벨, 시간) - None은 전체 기간
+_TABLE_PERIODS = (("1시간", 1), ("24시간", 24), ("전체", None))
+_TABLE_PERIOD_HOURS = tuple(hours for _label, hours in _TABLE_PERIODS)
+_EMPTY_SUM_GRID = ((0,) * 4,) * len(_TABLE_PERIODS)
+# 1시간/24시간 집계는 이벤트가 없어도 시간 창이 지나며 줄어들므로 주기적으로 전체 행 재조회 (tick 수)
+_TABLE_WINDOW_REFRESH_TICKS = 60
+
+# 카메라 상태/ROI 병렬 확인 상한 (오프라인 카메라의 타임아웃이 다른 카메라를 지연시키지 않도록)
+_CAM_POLL_WORKERS = 4
+
+# 카메라 ROI 좌표계 (0~8192) <-> 정규화 좌표 변환 계수
+_ROI_CAM_SCALE = 8192
+_ROI_CAM_INV = 1.0 / _ROI_CAM_SCALE
+
+def _poll_cameras(cams, poll_one):
+    """카메라별 poll_one(key, ip, user, pw)을 최대 _CAM_POLL_WORKERS개 동시 실행 (각 결과는 완료 즉시 emit)"""
+    if len(cams) <= 1:
+        for cam in cams:
+            poll_one(*cam)
+        return
+    with ThreadPoolExecutor(max_workers=min(_CAM_POLL_WORKERS, len(cams)), thread_name_prefix="cam_poll") as pool:
+        for cam in cams:
+            pool.submit(poll_one, *cam)
+
 class StatusWorkerSignals(QObject):
     result = Signal(str, bool, int) # key, connected, count
 
 class CameraStatusWorker(QRunnable):
-    """백그라운드에서 카메라 연결 상태와 영역 설정을 확인하는 워커"""
-    def __init__(self, key, ip, user, pw):
+    """
+    백그라운드에서 카메라 연결 상태와 영역 설정을 확인하는 워커
+    (cgi_client 공유 세션 사용, 카메라별 확인은 상한 내에서 병렬 실행)
+    """
+    def __init__(self, cams):
         super().__init__()
-        self.key = key
-        self.ip = ip
-        self.user = user
-        self.pw = pw
+        self.cams = [(c['key'], c['ip'], c['username'], c['password']) for c in cams]
         self.signals = StatusWorkerSignals()
 
     def run(self):
+        _poll_cameras(self.cams, self._check_one)
+
+    def _check_one(self, key, ip, user, pw):
         connected = False
         count = 0
         try:
-            text = fetch_region_data(self.ip, self.user, self.pw)
+            text = fetch_region_data(ip, user, pw, timeout=(3, 5))
             if text:
                 connected = True
                 count = parse_region_count(text)
         except Exception as e:
-            logger.debug(f"[StatusWorker] Check failed for {self.key}: {e}")
-        self.signals.result.emit(self.key, connected, count)
+            logger.debug(f"[StatusWorker] Check failed for {key}: {e}")
+        self.signals.result.emit(key, connected, count)
+
+class CgiRestartSignals(QObject):
+    stopped = Signal(str, str) # key, kind ("people" | "stay")
+
+class CgiRestartWorker(QRunnable):
+    """CGI 스레드 정지/종료 대기(join 최대 1초)를 풀 스레드에서 수행 (재시작은 GUI 스레드에서)"""
+    def __init__(self, key, kind, thread):
+        super().__init__()
+        self.key = key
+        self.kind = kind
+        self.thread = thread
+        self.signals = CgiRestartSignals()
+
+    def run(self):
+        try:
+            self.thread.stop()
+            self.thread.wait(1000)
+        except Exception as e:
+            logger.debug(f"[Recovery] Stop failed for {self.key}/{self.kind}: {e}")
+        self.signals.stopped.emit(self.key, self.kind)
 
 class RoiWorkerSignals(QObject):
     result = Signal(object, object, object) # key, {area_id: points}, [enabled_area_ids] (Use object to avoid QVariant conversion issues)
 
 class RoiLoadWorker(QRunnable):
-    """백그라운드에서 ROI 좌표를 로드하는 워커"""
-    def __init__(self, key, ip, user, pw):
+    """백그라운드에서 ROI 좌표를 로드하는 워커 (대상 카메라를 상한 내에서 병렬 로드)"""
+    def __init__(self, cams):
         super().__init__()
-        self.key = key
-        self.ip = ip
-        self.user = user
-        self.pw = pw
+        self.cams = [(c['key'], c['ip'], c['username'], c['password']) for c in cams]
         self.signals = RoiWorkerSignals()
 
     def run(self):
+        _poll_cameras(self.cams, self._load_one)
+
+    def _load_one(self, key, ip, user, pw):
         data = {}
         enabled_areas = set()
         try:
-            text = cgi_client.get_roi_raw_data(self.ip, self.user, self.pw)
+            text = cgi_client.get_roi_raw_data(ip, user, pw)
             txt_len = len(text) if text else 0
             
             if text:
                 data = cgi_client.parse_regions_by_area_raw(text)
                 
-                # Enable 상태 파싱 (정규식 직접 사용 또는 cgi_client 활용)
-                # cgi_client.get_roi_config는 내부에서 fetch를 또 하므로, 
-                # 여기서는 text 기반으로 직접 파싱하거나 cgi_client에 파서가 있다면 사용.
-                # cgi_client.py에 get_roi_config가 있지만 text를 인자로 받지 않음.
-                # 간단히 정규식으로 Enable=true인 인덱스를 찾아 매핑.
-                import re
-                # VideoAnalyseRule[0][idx].Config.AreaID=id AND .Enable=true
-                # cgi_client.get_roi_config 로직을 참고하여 구현 (여기서는 fetch 없이 text 파싱)
-                # (간소화: parse_region_count가 활성 영역 개수를 세므로, 여기서는 모든 영역 로드 후 기본 활성 간주하거나,
-                #  정확히 하려면 cgi_client.get_roi_config를 호출하는게 낫음. 
-                #  하지만 성능상 fetch 1번이 좋으므로, 일단 모든 영역을 enabled로 가정하거나, 
-                #  추후 cgi_client에 parse_roi_config(text) 추가 권장.
-                #  현재는 data에 있는 키들을 모두 enabled로 처리 (좌표가 있으면 표시))
+                # 좌표가 있는 영역은 모두 enabled로 처리 (좌표가 있으면 표시)
                 enabled_areas = set(data.keys())
-                logger.debug(f"[RoiLoadWorker] {self.key}: Assuming all {len(enabled_areas)} loaded areas are ENABLED.")
+                logger.debug(f"[RoiLoadWorker] {key}: Assuming all {len(enabled_areas)} loaded areas are ENABLED.")
                 
                 # 상세 로그: 각 Area별 포인트 개수 확인
                 area_summary = {k: len(v) for k, v in data.items()}
-                logger.info(f"[ROI] Loaded {self.key}: len={txt_len}, areas={area_summary}, enabled={enabled_areas}")
+                logger.info(f"[ROI] Loaded {key}: len={txt_len}, areas={area_summary}, enabled={enabled_areas}")
             else:
-                logger.warning(f"[RoiLoadWorker] {self.key} fetch returned empty/None")
+                logger.warning(f"[RoiLoadWorker] {key} fetch returned empty/None")
         except Exception as e:
-            logger.error(f"[RoiLoadWorker] Error {self.key}: {e}")
+            logger.error(f"[RoiLoadWorker] Error {key}: {e}")
         # Set을 List로 변환하여 전송 (Qt 메타타입 변환 문제 방지)
-        self.signals.result.emit(self.key, data, list(enabled_areas))
+        self.signals.result.emit(key, data, list(enabled_areas))
 
 class WindowSum(QMainWindow):
     def __init__(self):
@@ -110,6 +183,15 @@ class WindowSum(QMainWindow):
         self.setWindowTitle("OPAS-200 - ver 1.0 (RPi)")
         self._closing = False
         self.resize(1280, 800)
+
+        # 이벤트 로그 표시는 100ms 단위로 모아서 모델에 1회 반영 (add_event_log보다 먼저 준비)
+        self._pending_log = [] # [(text, is_alarm)]
+        self._debug_window_start = 0 # DEBUG 로그 1초 창 시작 (monotonic_ns)
+        self._debug_window_count = 0 # 현재 창의 DEBUG 로그 건수
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(100)
+        self._log_flush_timer.timeout.connect(self._flush_event_log)
         
         # 설정 매니저 초기화 및 로드
         self.cfg_mgr = ConfigManager()
@@ -137,8 +219,20 @@ class WindowSum(QMainWindow):
         self._connect_ui_signals()
         
         # UI 변수 초기화 (reload_cameras 등에서 참조)
-        self.tiles = {}  # {camera_key: {'frame': QFrame, 'video': VideoWidget, 'label': QLabel, 'layout': QStackedLayout}}
+        self.tiles = {}  # {camera_key: {'frame': QFrame, 'video': VideoWidget, 'label': QLabel}}
+        self._playing_keys = set() # PLAYING 상태인 타일의 camera_key (VideoWidget.playing_changed로 갱신)
         self.camera_items = {} # {camera_key: CameraListItem} - UI 제어용
+        self._key_to_list_item = {} # {camera_key: QListWidgetItem} - 리스트 선형 탐색 대체
+        self._prev_cam_snapshots = {} # {camera_key: tuple(sorted(cam.items()))} - reload 시 변경분 판별용
+        # 설정 순서를 유지하므로 values()를 카메라 목록 캐시로도 사용 (get_cameras 재파싱 생략)
+        self._camera_by_key = {} # {camera_key: cam_dict} - 이벤트/ROI 경로의 O(1) 카메라 조회용 (reload 시 재구성)
+        self._dirty_rows = set() # 모니터링 표에서 변경된 카메라 key (해당 행만 재생성)
+        self._row_values_cache = {} # {camera_key: (label_text, summary_values, realtime_values)}
+        self._table_row_index = {} # {camera_key: 표 내 카메라 순번} - 셀 단위 갱신 시 행 위치 계산용
+        self._sum_table = None # 집계 표 QTextTable (전체 재구성 시 갱신)
+        self._rt_table = None # 실시간 표 QTextTable
+        self._tables_stale = True # 카메라 목록 변경 등 전체 재구성 필요 (초기 표시를 위해 True로 시작)
+        self._last_stretch_mode = None # 마지막으로 적용된 그리드 스트레치 모드 (None이면 미적용/무효화)
         self.threadpool = QThreadPool()
         
         # 이벤트 관련 상태
@@ -146,20 +240,25 @@ class WindowSum(QMainWindow):
         self.total_events = 0
         self._last_people_total = {} # {camera_key: {area_id: count}}
         self.stay_states = {} # {(camera_key, area_id): True | False}
-        self.last_event_timestamps = {} # {(camera_key, area_id): timestamp}
-        self.gpio_last_trigger_ts = {} # {(camera_key, area_id, type): timestamp} [Commit 17-1]
-        self.stay_last_emit = {} # {(camera_key, area_id, action): timestamp}
-        self._stay_clear_timers = {} # {(camera_key, area_id): QTimer}
+        # 쿨다운/디바운스용 시각은 모두 time.monotonic_ns() 정수 (벽시계 보정에 영향 없음)
+        self.last_event_timestamps = {} # {(camera_key, area_id): monotonic_ns}
+        self.gpio_last_trigger_ts = {} # {(camera_key, area_id, type): monotonic_ns} [Commit 17-1]
+        self.stay_last_emit = {} # {(camera_key, area_id, action): monotonic_ns}
+        self._stay_clear_timers = {} # {(camera_key, area_id): QTimer} - 키별 1개를 재사용 (재시작으로 연장)
         self.discovered_areas = {} # {camera_key: set(area_ids)}
         self.realtime_counts = {} # {camera_key: {area_id: count}}
         self.camera_conn_status = {} # {camera_key: bool} - 연결 상태 추적용
         self.event_cooldown_sec = self.config.getint('event', 'cooldown_sec', fallback=2)
         self.stay_cooldown_sec = self.config.getint('event', 'stay_cooldown_sec', fallback=10)
+        self._event_cooldown_ns = self.event_cooldown_sec * 1_000_000_000
+        self._stay_cooldown_ns = self.stay_cooldown_sec * 1_000_000_000
+        # 쿨다운이 충분히 지난 항목은 '기록 없음'과 동일하므로 주기적으로 제거 (area 변동 시 무한 증가 방지)
+        self._debounce_prune_ns = 10 * max(self._event_cooldown_ns, self._stay_cooldown_ns, 1_000_000_000)
         self.stay_hold_ms = self.config.getint('event', 'stay_hold_ms', fallback=10000)
         self.log_load_limit = self.config.getint('event', 'log_load_limit', fallback=200)
-        self._last_restart_time_event = {} # {camera_key: timestamp}
-        self._last_restart_time_video = {} # {camera_key: timestamp}
-        self._pc_restart_inflight = {} # [FIX-2] PeopleCount 재시작 중복 방지 플래그
+        self._last_restart_time_event = {} # {camera_key: monotonic_ns}
+        self._last_restart_time_video = {} # {camera_key: monotonic_ns}
+        self._cgi_restart_inflight = set() # [FIX-2] {(camera_key, kind)} CGI 스레드 재시작 중복 방지
         self._rebuilding_grid = False
         self._pending_grid_cameras = None # [CRITICAL FIX v3] Pending cameras for async build
         self._starting_monitor = False
@@ -211,32 +310,14 @@ class WindowSum(QMainWindow):
         # 초기 카메라 목록 로드 (UI 구성 완료 후 호출)
         self.reload_cameras()
         
-        # UI 갱신 타이머 (1초 주기, 이벤트 발생 시 dirty 플래그로 갱신)
-        self.ui_dirty = True # 초기 표시를 위해 True로 시작
-        self.ui_update_timer = QTimer(self)
-        self.ui_update_timer.timeout.connect(self.update_monitoring_tables)
-        self.ui_update_timer.start(1000)
+        # UI 갱신은 1초 하트비트(_on_tick)에서 처리 (이벤트 발생 시 dirty 행만 갱신)
         
         # GPIO UI 초기 상태 갱신
         self._update_gpio_status_ui()
         if self.gpio_bridge.is_connected:
             self.add_gpio_log("[System] GPIO Initialized (Connected)")
 
-        # 진단 로그 타이머 (10초 주기)
-        self.stats_log_timer = QTimer(self)
-        self.stats_log_timer.timeout.connect(self.log_stats_debug)
-        self.stats_log_timer.start(10000)
         self.add_event_log(f"[DEBUG] PeopleCount epoch now={int(time.time())}, tz={time.tzname}")
-
-        # [New] 헬스체크 타이머 (10초 주기)
-        self.health_timer = QTimer(self)
-        self.health_timer.timeout.connect(self.check_thread_health)
-        self.health_timer.start(10000)
-
-        # [New] 시스템 상태 갱신 타이머 (5초 주기)
-        self.sys_status_timer = QTimer(self)
-        self.sys_status_timer.timeout.connect(self.update_system_status)
-        self.sys_status_timer.start(5000)
         
         # ROI Edit State
         self.is_video_maximized = False
@@ -246,27 +327,68 @@ class WindowSum(QMainWindow):
         self.roi_mode = "monitor" # [추가] 초기 모드 설정 (monitor | view | edit)
         self.roi_cache = {} # {camera_key: {'norm': dict, 'enabled': set}}
         self.roi_backup_cache = {} # For cancel revert {camera_key: {'norm': ..., 'enabled': ...}}
+        self._roi_load_inflight = set() # 로드 결과 대기 중인 camera_key (재시작 시 중복 CGI 요청 방지)
+        self._roi_last_applied = {} # {camera_key: (VideoWidget, signature)} - 동일 ROI 재적용 생략용
+        self._roi_cache_rev = {} # {camera_key: int} - roi_cache 변경 시 증가 (적용 signature에 사용)
         self._rebind_timer = QTimer(self) # 디바운스용 타이머
         self._rebind_timer.setSingleShot(True)
         self._rebind_timer.timeout.connect(self._perform_rebind_visible)
         self._connect_roi_signals()
         self.ui.tabs.currentChanged.connect(self.on_tab_changed)
-        
-        # [추가] 로그 자정 롤오버 체크 타이머 (1분 주기)
-        self.log_rotate_timer = QTimer(self)
-        self.log_rotate_timer.timeout.connect(check_and_rotate_log)
-        self.log_rotate_timer.start(60000) # 60초마다 체크
 
         # [Commit M1-2] Idle Monitor 설정 및 초기화
         self.idle_stop_enable = self.config.getboolean('monitor', 'idle_stop_enable', fallback=True)
         self.idle_stop_sec = self.config.getint('monitor', 'idle_stop_sec', fallback=300)
-        self._last_user_activity_ts = time.time()
+        self._idle_stop_ns = self.idle_stop_sec * 1_000_000_000
+        self._last_user_activity_ts = time.monotonic_ns()
         self._auto_stop_fired = False
         
         QApplication.instance().installEventFilter(self)
-        self.idle_timer = QTimer(self)
-        self.idle_timer.timeout.connect(self._check_idle_stop)
-        self.idle_timer.start(10000) # 10초마다 체크
+
+        # 주기 작업 통합 하트비트 (1초) - 개별 타이머 대신 tick 배수로 분배
+        #   1s: 모니터링 테이블 / 5s: 시스템 상태 / 10s: 진단 로그, 헬스체크, Idle 체크 / 60s: 로그 롤오버
+        self._tick_count = 0
+        self._tick = QTimer(self)
+        self._tick.setTimerType(Qt.CoarseTimer)
+        self._tick.timeout.connect(self._on_tick)
+        self._tick.start(1000)
+
+        # 이벤트 버스트 시 상태바 갱신을 100ms 단위로 병합
+        self._status_refresh_timer = QTimer(self)
+        self._status_refresh_timer.setSingleShot(True)
+        self._status_refresh_timer.setInterval(100)
+        self._status_refresh_timer.timeout.connect(self.update_status_bar)
+
+        # CPU/MEM 샘플링은 백그라운드 스레드에서 수행 (psutil 미설치 시 tick 폴백)
+        self._sys_stat = SysStatSampler(1.0)
+        self._sys_stat.stats_updated.connect(self._set_system_bars)
+        self._sys_stat_active = self._sys_stat.start()
+
+    def _on_tick(self):
+        """1초 하트비트: 주기 작업을 tick 배수로 디스패치"""
+        if self._closing:
+            return
+        self._tick_count += 1
+        n = self._tick_count
+
+        if n % _TABLE_WINDOW_REFRESH_TICKS == 0:
+            self._expire_table_rows()
+        jobs = [self.update_monitoring_tables]
+        if n % 5 == 0 and not self._sys_stat_active:
+            jobs.append(self.update_system_status)
+        if n % 10 == 0:
+            jobs += [self.log_stats_debug, self.check_thread_health, self._check_idle_stop]
+        if n % 60 == 0:
+            jobs += [check_and_rotate_log, self._prune_debounce_tables]
+
+        # 한 작업의 예외가 같은 tick의 나머지 작업을 막지 않도록 개별 처리
+        for job in jobs:
+            try:
+                job()
+            except Exception as e:
+                allow, suppressed = should_log(f"tick_{job.__name__}", 60)
+                if allow:
+                    logger.error(f"[Tick] {job.__name__} failed: {e}" + (f" (suppressed {suppressed})" if suppressed > 0 else ""))
 
     def on_purge_completed(self, deleted_count, retention_days, error):
         """DB 정리 완료 시 호출되는 콜백 (DB 워커 스레드에서 실행됨)"""
@@ -276,7 +398,8 @@ class WindowSum(QMainWindow):
             msg = f"[System] DB Purge: {deleted_count} rows deleted (older than {retention_days} days)"
         
         # UI 업데이트를 메인 스레드에서 안전하게 실행
-        QTimer.singleShot(0, lambda: self.add_event_log(msg))
+        # DB 워커(비 Qt) 스레드에서 호출되므로 GUI 스레드로 큐잉 (타이머/람다 생성 없음)
+        QMetaObject.invokeMethod(self, "add_event_log", Qt.ConnectionType.QueuedConnection, Q_ARG(str, msg))
         
     def _connect_ui_signals(self):
         """UI 요소의 시그널을 슬롯에 연결"""
@@ -287,26 +410,35 @@ class WindowSum(QMainWindow):
         self.ui.btn_ref.clicked.connect(self.reload_cameras)
         self.ui.btn_mon.clicked.connect(self.on_btn_start_clicked)
         self.ui.btn_stop.clicked.connect(self.on_btn_stop_clicked)
+        # DEBUG 표시 여부 캐시 (이벤트 핫패스에서 isChecked() 호출 대체)
+        self._debug_enabled = self.ui.chk_show_debug.isChecked()
+        self.ui.chk_show_debug.stateChanged.connect(self._on_debug_toggled) # 캐시 갱신이 먼저 실행되도록 선 연결
         self.ui.chk_show_debug.stateChanged.connect(self.reload_recent_events_filter)
         self.ui.chk_keep_watching.stateChanged.connect(self.on_keep_watching_changed)
 
-        # GPIO 버튼 연결
-        if hasattr(self.ui, 'btn_conn'):
-            self.ui.btn_conn.clicked.connect(self.on_gpio_connect_clicked)
-        if hasattr(self.ui, 'btn_disc'):
-            self.ui.btn_disc.clicked.connect(self.on_gpio_disconnect_clicked)
-        if hasattr(self.ui, 'btn_test'):
-            self.ui.btn_test.clicked.connect(self.on_gpio_test_clicked)
+        # GPIO 버튼 연결 (WindowUI.__init__에서 None으로 선언, GPIO 그룹 구성 시 생성)
+        gpio_slots = (
+            (self.ui.btn_conn, self.on_gpio_connect_clicked),
+            (self.ui.btn_disc, self.on_gpio_disconnect_clicked),
+            (self.ui.btn_test, self.on_gpio_test_clicked),
+        )
+        for btn, slot in gpio_slots:
+            if btn is not None:
+                btn.clicked.connect(slot)
+
+    def _on_debug_toggled(self, state):
+        """DEBUG 체크박스 상태를 캐시에 반영"""
+        self._debug_enabled = (state == Qt.CheckState.Checked.value)
 
     def on_keep_watching_changed(self, state):
         status = "ON" if state == Qt.CheckState.Checked.value else "OFF"
         logger.info(f"[Main] Keep Watching toggled: {status}")
 
     def _connect_roi_signals(self):
-        self.ui.btn_roi_area1.clicked.connect(lambda: self.on_roi_area_clicked(1))
-        self.ui.btn_roi_area2.clicked.connect(lambda: self.on_roi_area_clicked(2))
-        self.ui.btn_roi_area3.clicked.connect(lambda: self.on_roi_area_clicked(3))
-        self.ui.btn_roi_area4.clicked.connect(lambda: self.on_roi_area_clicked(4))
+        for n, btn in enumerate((self.ui.btn_roi_area1, self.ui.btn_roi_area2,
+                                 self.ui.btn_roi_area3, self.ui.btn_roi_area4), start=1):
+            # clicked(bool) 인자를 흡수하고 area 번호는 기본 인자로 고정
+            btn.clicked.connect(lambda _checked=False, area_id=n: self.on_roi_area_clicked(area_id))
         self.ui.btn_roi_save.clicked.connect(self.on_roi_save)
         self.ui.btn_roi_cancel.clicked.connect(self.on_roi_cancel)
 
@@ -320,46 +452,82 @@ class WindowSum(QMainWindow):
         if not hasattr(self.ui, "camera_list"):
             return
 
-        # 1. 안전하게 모든 작업 중지
-        self.stop_events()
-        self.stop_all_streams()
-        
-        # [수정] 스트리밍이 중지되므로 모니터링 체크 상태도 초기화 (스트리밍 OFF = 체크 OFF)
-        self.state_mgr.clear_all_monitor_enabled()
-        
         self.cfg_mgr.reload()
         cameras = self.cfg_mgr.get_cameras()
-
-        # 시그널 차단 (갱신 중 불필요한 이벤트 방지)
-        self.ui.camera_list.blockSignals(True)
-        self.ui.camera_list.clear()
-        self.camera_items.clear()
-        
-        self.discovered_areas.clear()
-        self._last_people_total.clear()
+        self._camera_by_key = {cam['key']: cam for cam in cameras}
+
+        # 1. 이전 설정과 비교하여 제거/변경된 카메라만 판별 (변경 없는 카메라의 스트림/이벤트 스레드는 유지)
+        new_snapshots = {cam['key']: tuple(sorted(cam.items())) for cam in cameras}
+        prev_snapshots = self._prev_cam_snapshots
+        removed_keys = [k for k in prev_snapshots if k not in new_snapshots]
+        changed_keys = {k for k, snap in new_snapshots.items() if k in prev_snapshots and prev_snapshots[k] != snap}
+        self._prev_cam_snapshots = new_snapshots
+
+        if not prev_snapshots:
+            # 최초 로드: 스트리밍 OFF 상태이므로 모니터링 체크 상태도 초기화 (스트리밍 OFF = 체크 OFF)
+            self.state_mgr.clear_all_monitor_enabled()
+
+        # 2. 제거/변경된 카메라만 안전하게 정지
+        for key in removed_keys + list(changed_keys):
+            self.cleanup_camera_resources(key, reason="Reload", stop_video=True)
+            if key in self.tiles:
+                self._set_tile_stopped(self.tiles[key], True)
+            if self.state_mgr.get_monitor_enabled(key):
+                self.state_mgr.set_monitor_enabled(key, False)
+            self.discovered_areas.pop(key, None)
+            self._last_people_total.pop(key, None)
+            self.camera_conn_status.pop(key, None)
+            # 설정(이름/IP) 변경 반영을 위해 해당 테이블 행 캐시 무효화
+            self._row_values_cache.pop(key, None)
+        self._tables_stale = True
+
+        # 삭제된 카메라의 영상 타일은 다음 Start까지 남지 않도록 그리드에서 제거
+        for key in removed_keys:
+            self._remove_video_tile(key)
+
+        # 시그널 차단 + 화면 갱신 보류 (항목 삽입/위젯 교체마다 재배치/repaint 방지)
+        self.ui.begin_bulk_camera_update()
+
+        # 등록된 카메라 항목이 없으면 리스트에는 "No Camera" 안내 항목만 있으므로 제거
+        if not self._key_to_list_item:
+            self.ui.camera_list.clear()
+
+        for key in removed_keys:
+            self.camera_items.pop(key, None)
+            item = self._key_to_list_item.pop(key, None)
+            if item is not None:
+                self.ui.camera_list.takeItem(self.ui.camera_list.row(item))
         
         if not cameras:
             item = QListWidgetItem("No Camera")
             item.setData(Qt.UserRole, None)
             self.ui.camera_list.addItem(item)
         else:
-            for cam in cameras:
-                # 커스텀 위젯 사용
-                # CameraListItem은 이제 window_ui에서 import
-                item = QListWidgetItem(self.ui.camera_list)
-                item.setData(Qt.UserRole, cam['key'])
-                item.setSizeHint(QSize(0, 80)) # 높이 지정
+            # 카메라 목록은 번호순 정렬이므로 신규 항목은 해당 순번 위치에 삽입
+            for row, cam in enumerate(cameras):
+                key = cam['key']
+                item = self._key_to_list_item.get(key)
+                if item is None:
+                    item = QListWidgetItem()
+                    item.setData(Qt.UserRole, key)
+                    item.setSizeHint(QSize(0, 80)) # 높이 지정
+                    self.ui.camera_list.insertItem(row, item)
+                    self._key_to_list_item[key] = item
+                elif key not in changed_keys:
+                    continue # 변경 없음
                 
+                # 커스텀 위젯 사용 (변경된 카메라는 기존 항목에 위젯만 교체)
+                # CameraListItem은 이제 window_ui에서 import
                 widget = CameraListItem(cam, self.state_mgr)
                 widget.sig_area_changed.connect(self.on_card_area_changed)
                 
-                self.camera_items[cam['key']] = widget
+                self.camera_items[key] = widget
                 self.ui.camera_list.setItemWidget(item, widget)
                 
-                # 비동기 상태 확인 시작
-                worker = CameraStatusWorker(cam['key'], cam['ip'], cam['username'], cam['password'])
-                worker.signals.result.connect(self.on_camera_status_update)
-                self.threadpool.start(worker)
+            # 비동기 상태 확인 시작 (워커 1개가 카메라별 확인을 병렬 실행)
+            worker = CameraStatusWorker(cameras)
+            worker.signals.result.connect(self.on_camera_status_update)
+            self.threadpool.start(worker)
         
         # 그리드는 모니터링 시작 시 구성하므로 여기서는 생략 가능하지만,
         # 초기화 차원에서 전체 목록으로 구성해둘 수도 있음. (여기선 생략)
@@ -367,16 +535,14 @@ class WindowSum(QMainWindow):
         # 선택 상태 복원 (삭제되지 않았다면)
         target_key = selected_key or self.state_mgr.get("last_camera_key")
         if target_key:
-            for i in range(self.ui.camera_list.count()):
-                item = self.ui.camera_list.item(i)
-                if item.data(Qt.UserRole) == target_key:
-                    self.ui.camera_list.setCurrentItem(item)
-                    break
+            item = self._key_to_list_item.get(target_key)
+            if item is not None:
+                self.ui.camera_list.setCurrentItem(item)
         
-        self.ui.camera_list.blockSignals(False)
+        self.ui.end_bulk_camera_update()
         
         # 상태바 업데이트 (존재할 경우)
-        if hasattr(self.ui, 'status_bar'):
+        if self.ui.status_bar is not None:
             keys = [c["key"] for c in cameras]
             config_path_str = str(self.cfg_mgr.config_file)
             self.ui.status_bar.showMessage(f"Cameras: {len(cameras)} | Keys: {','.join(keys)} | Config: {config_path_str}")
@@ -424,24 +590,23 @@ class WindowSum(QMainWindow):
             
         # 상태 저장
         self.camera_conn_status[key] = connected
-        self.ui_dirty = True # 테이블 갱신 트리거
+        self._dirty_rows.add(key) # 해당 카메라 행만 갱신
 
-        for i in range(self.ui.camera_list.count()):
-            item = self.ui.camera_list.item(i)
-            if item.data(Qt.UserRole) == key:
-                widget = self.ui.camera_list.itemWidget(item)
-                if widget:
-                    widget.update_device_info(connected, count)
-                    widget.set_counts_visible(connected) # 연결 끊기면 LED 초기화
-                break
+        widget = self.camera_items.get(key)
+        if widget is not None:
+            widget.update_device_info(connected, count)
+            widget.set_counts_visible(connected) # 연결 끊기면 LED 초기화
 
     def _apply_grid_stretch(self, split_mode):
-        """분할 모드에 따라 그리드 스트레치를 설정합니다."""
-        # 1. 모든 스트레치 초기화 (잔여 설정 제거 - 범위를 넉넉하게 10까지)
-        # 간헐적 깨짐 방지를 위해 명시적으로 0으로 초기화
-        for r in range(10):
+        """분할 모드에 따라 그리드 스트레치를 설정합니다. (동일 모드 재적용 시 생략)"""
+        if self._last_stretch_mode == split_mode:
+            return
+
+        # 1. 사용 행/열 스트레치 초기화 (간헐적 깨짐 방지를 위해 명시적으로 0으로 초기화)
+        # 2x2 그리드 기준. 확대 시 (0,0,10,10) 배치의 나머지 행/열은 0 이외로 설정되지 않음
+        for r in range(_STRETCH_CLEAR_RANGE):
             self.ui.video_grid.setRowStretch(r, 0)
-        for c in range(10):
+        for c in range(_STRETCH_CLEAR_RANGE):
             self.ui.video_grid.setColumnStretch(c, 0)
 
         # 2. 모드별 스트레치 적용
@@ -456,6 +621,8 @@ class WindowSum(QMainWindow):
             self.ui.video_grid.setColumnStretch(0, 1)
             self.ui.video_grid.setColumnStretch(1, 1)
 
+        self._last_stretch_mode = split_mode
+
     def rebuild_grid(self, cameras):
         """카메라 수에 따라 그리드를 재구성합니다."""
         if self._rebuilding_grid:
@@ -477,16 +644,15 @@ class WindowSum(QMainWindow):
 
             QApplication.processEvents()
 
-            # 3. Qt 위젯은 deleteLater 사용
-            for i in reversed(range(self.ui.video_grid.count())):
-                item = self.ui.video_grid.itemAt(i)
+            # 3. Qt 위젯은 deleteLater 사용 (takeAt이 레이아웃에서 제거까지 수행)
+            while (item := self.ui.video_grid.takeAt(0)) is not None:
                 widget = item.widget()
                 if widget:
-                    self.ui.video_grid.removeWidget(widget)
                     widget.setParent(None)
                     widget.deleteLater()
 
             self.tiles.clear()
+            self._roi_last_applied.clear()
             
             QApplication.processEvents()
 
@@ -549,9 +715,11 @@ class WindowSum(QMainWindow):
         tile_frame.setLineWidth(1)
         tile_frame.setStyleSheet("border: 1px solid gray;")
         
-        # 2. 메인 스택 (VideoContainer vs StatusLabel)
-        main_stack = QStackedLayout(tile_frame)
-        main_stack.setStackingMode(QStackedLayout.StackingMode.StackOne)
+        # 2. 메인 레이아웃 (VideoContainer / StatusLabel 중 하나만 표시 - _set_tile_stopped)
+        # VideoWidget은 네이티브 윈도우라 겹쳐 띄우지 않고 표시/숨김으로 전환
+        main_layout = QVBoxLayout(tile_frame)
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.setSpacing(0)
         
         # 3. Video Widget
         # ROI Overlay는 이제 VideoWidget 내부의 cairooverlay가 담당하므로 별도 위젯 불필요
@@ -559,24 +727,24 @@ class WindowSum(QMainWindow):
         video_widget = VideoWidget(parent=tile_frame) # [CRITICAL FIX v3] Parent 지정
         video_widget.clicked.connect(self.on_video_tile_clicked)
         video_widget.doubleClicked.connect(self.on_video_double_clicked)
+        video_widget.playing_changed.connect(self._on_video_playing_changed)
         
         # 4. 상태 라벨
         status_label = QLabel("STOPPED")
         status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         status_label.setStyleSheet("background-color: black; color: white; font-size: 16px; font-weight: bold; border: none;")
         
-        main_stack.addWidget(video_widget)
-        main_stack.addWidget(status_label)
-        main_stack.setCurrentIndex(1)  # 초기 상태는 STOPPED
+        main_layout.addWidget(video_widget)
+        main_layout.addWidget(status_label)
 
         self.ui.video_grid.addWidget(tile_frame, row, col, row_span, col_span)
         
         self.tiles[key] = {
             'frame': tile_frame,
             'video': video_widget,
-            'label': status_label,
-            'layout': main_stack
+            'label': status_label
         }
+        self._set_tile_stopped(self.tiles[key], True)  # 초기 상태는 STOPPED
         
         # [Commit ROI-FIX-1] VideoWidget 생성 직후 ROI 캐시 적용 (레이스 해결)
         if key in self.roi_cache:
@@ -592,13 +760,41 @@ class WindowSum(QMainWindow):
             
         # 미디어 설정 (재생 준비)
         if self.config.has_section(key):
-            cam_cfg = dict(self.config[key])
-            url = build_rtsp_url(cam_cfg)
+            # cam_data(get_cameras 결과)로 직접 생성 후 dict에 캐시 (ConfigParser 섹션 복사 생략)
+            url = cam_data.get('_rtsp_url')
+            if url is None:
+                url = cam_data['_rtsp_url'] = build_rtsp_url(cam_data)
             # 실제 사용 URL 로그 (1회성)
             if not video_widget.is_ready: # 최초 설정 시에만 로그
                 self.add_event_log(f"[DEBUG] [{key}] RTSP_URL={url}")
             video_widget.set_media(url, key)
 
+    def _set_tile_stopped(self, tile_data, stopped):
+        """타일의 영상/STOPPED 라벨 표시 전환"""
+        tile_data['video'].setVisible(not stopped)
+        tile_data['label'].setVisible(stopped)
+
+    def _remove_video_tile(self, key):
+        """영상 타일을 그리드에서 제거하고 같은 위치에 빈 타일을 배치합니다. (파이프라인은 cleanup_camera_resources에서 해제)"""
+        tile = self.tiles.get(key)
+        if tile is None:
+            return
+        # 확대 상태면 원래 배치로 복원 후 제거 (숨겨진 타일/저장된 위치 정보 정리)
+        if self.is_video_maximized:
+            self.reset_video_grid_layout("CameraRemoved")
+
+        frame = tile['frame']
+        idx = self.ui.video_grid.indexOf(frame)
+        pos = self.ui.video_grid.getItemPosition(idx) if idx >= 0 else None
+        self.ui.video_grid.removeWidget(frame)
+        frame.setParent(None)
+        frame.deleteLater()
+        del self.tiles[key]
+        self._roi_last_applied.pop(key, None)
+        if pos is not None:
+            self._add_empty_tile(*pos)
+        logger.debug(f"[Layout] Removed video tile for {key}")
+
     def _add_empty_tile(self, row, col, row_span=1, col_span=1):
         # 빈 타일도 모양 통일
         tile_frame = QFrame()
@@ -618,7 +814,7 @@ class WindowSum(QMainWindow):
         레이아웃 상태를 강제로 초기화하고 복원합니다. (비율 깨짐 방지용 단일 API)
         """
         # 진단 로그
-        if self.ui.chk_show_debug.isChecked():
+        if self._debug_enabled:
             row_stretches = [self.ui.video_grid.rowStretch(r) for r in range(3)]
             col_stretches = [self.ui.video_grid.columnStretch(c) for c in range(3)]
             logger.info(f"[Layout] Reset reason={reason}, maximized={self.is_video_maximized}, key={self.maximized_camera_key}")
@@ -629,9 +825,8 @@ class WindowSum(QMainWindow):
         # 1. 확대 상태라면 복원 (기존 로직 활용)
         if self.is_video_maximized:
             # toggle_maximize_video가 내부적으로 복원 로직(remove->add)을 수행함
+            # (핸들 재바인딩은 toggle 쪽에서 100ms 후 비동기로 진행되므로 여기서 대기하지 않음)
             self.toggle_maximize_video(self.maximized_camera_key)
-            QApplication.processEvents()
-            time.sleep(0.1)
             
         # 2. 상태 변수 강제 초기화 (안전장치)
         self.is_video_maximized = False
@@ -642,8 +837,7 @@ class WindowSum(QMainWindow):
         # 3. 모든 타일 보이기 및 ROI 편집 종료
         for key, tile in self.tiles.items():
             tile['frame'].setVisible(True)
-            # 편집 모드 해제
-            tile['video'].set_roi_edit(None, False)
+            # 편집 모드 해제 (monitor 모드 적용 시 함께 처리)
             self.roi_apply_to_video(key)
 
         # 4. ROI UI 숨김
@@ -657,6 +851,7 @@ class WindowSum(QMainWindow):
             split_mode = 4
         if split_mode not in (1, 4):
             split_mode = 4
+        self._last_stretch_mode = None # 강제 재적용
         self._apply_grid_stretch(split_mode)
         
         # 6. 레이아웃 갱신 강제
@@ -726,13 +921,8 @@ class WindowSum(QMainWindow):
             for k in self.tiles.keys():
                 self.roi_exit_edit(k, commit=False)
             
-            # Rebind window handles (디바운스 적용)
-            self._schedule_rebind_visible()
-            # 상태바 갱신
-            self.update_status_bar()
-            
-            QApplication.processEvents()
-            time.sleep(0.1)
+            # GStreamer flush 대기 (GUI 스레드 블로킹 없이 100ms 후 이어서 처리)
+            QTimer.singleShot(100, self._toggle_maximize_finish)
 
         else:
             # 확대
@@ -752,26 +942,38 @@ class WindowSum(QMainWindow):
                 'colSpan': colSpan
             }
             
-            # 다른 위젯 숨기기 (removeWidget 대신 hide 사용)
-            for k, tile in self.tiles.items():
-                if k != camera_key:
-                    tile['frame'].setVisible(False)
-            
-            # [수정] 타겟 타일을 그리드 전체(0,0,10,10)로 재배치하여 여백 제거
-            self.ui.video_grid.removeWidget(tile_frame)
-            self.ui.video_grid.addWidget(tile_frame, 0, 0, 10, 10)
-            
-            # 타겟 타일 보이기 (이미 보이지만 확실히)
-            tile_frame.setVisible(True)
-
-            # 스트레치 조정 (0,0에만 부여)
-            for r in range(self.ui.video_grid.rowCount()):
-                self.ui.video_grid.setRowStretch(r, 1 if r == 0 else 0)
-            for c in range(self.ui.video_grid.columnCount()):
-                self.ui.video_grid.setColumnStretch(c, 1 if c == 0 else 0)
+            # 재배치 중간 상태가 그려지지 않도록 컨테이너 페인트를 잠시 중단 (재개 시 1회 갱신)
+            grid = self.ui.video_grid
+            container = self.ui.video_container
+            container.setUpdatesEnabled(False)
+            try:
+                # 다른 위젯 숨기기 (removeWidget 대신 hide 사용)
+                for k, tile in self.tiles.items():
+                    if k != camera_key:
+                        tile['frame'].setVisible(False)
+
+                # [수정] 타겟 타일을 그리드 전체(0,0,10,10)로 재배치하여 여백 제거
+                grid.removeWidget(tile_frame)
+                grid.addWidget(tile_frame, 0, 0, 10, 10)
+
+                # 타겟 타일 보이기 (이미 보이지만 확실히)
+                tile_frame.setVisible(True)
+
+                # 스트레치 조정 (0,0에만 부여) - 직접 변경하므로 캐시 무효화
+                n_rows = grid.rowCount()
+                n_cols = grid.columnCount()
+                grid.setRowStretch(0, 1)
+                for r in range(1, n_rows):
+                    grid.setRowStretch(r, 0)
+                grid.setColumnStretch(0, 1)
+                for c in range(1, n_cols):
+                    grid.setColumnStretch(c, 0)
+                self._last_stretch_mode = None
+            finally:
+                container.setUpdatesEnabled(True)
             
             # ROI UI 표시
-            cam = next((c for c in self.cfg_mgr.get_cameras() if c['key'] == camera_key), None)
+            cam = self._camera_by_key.get(camera_key)
             name = cam['name'] if cam else camera_key
             self.ui.lbl_roi_target.setText(f"Target: {name}")
             self.ui.group_roi_edit.setVisible(True)
@@ -781,14 +983,22 @@ class WindowSum(QMainWindow):
             self.roi_mode = "view"
             
             # [수정] 확대 시 View 모드 진입 (전체 표시, 편집 불가)
-            self.roi_apply_to_video(camera_key) # view 모드 적용 (전체 ROI 표시)
-            self.tiles[camera_key]['video'].set_roi_edit(None, False) # 편집 불가 명시
+            self.roi_apply_to_video(camera_key) # view 모드 적용 (전체 ROI 표시, 편집 불가)
             
             # Rebind window handle (디바운스 적용)
             self._schedule_rebind_visible()
             
             self.update_status_bar()
 
+    def _toggle_maximize_finish(self):
+        """확대 복원 후속 처리 (윈도우 핸들 재바인딩 + 상태바 갱신)"""
+        if self._closing:
+            return
+        # Rebind window handles (디바운스 적용)
+        self._schedule_rebind_visible()
+        # 상태바 갱신
+        self.update_status_bar()
+
     def on_roi_area_clicked(self, area_id):
         # 확대 상태가 아니면 무시 (방어 코드)
         if not self.is_video_maximized:
@@ -800,12 +1010,12 @@ class WindowSum(QMainWindow):
         if self.is_video_maximized and self.maximized_camera_key:
             # [수정] 버튼 클릭 시 Edit 모드 진입
             self.roi_mode = "edit"
-            self.roi_enter_edit(self.maximized_camera_key, area_id)
-            self.roi_apply_to_video(self.maximized_camera_key) # 화면 갱신
+            self.roi_enter_edit(self.maximized_camera_key, area_id) # 백업 + 화면 갱신
 
     @Slot(object, object, object)
     def on_roi_loaded(self, key, data_8192, enabled_areas_list):
         """비동기 ROI 로드 완료 핸들러"""
+        self._roi_load_inflight.discard(key)
         if self._closing:
             return
             
@@ -818,17 +1028,14 @@ class WindowSum(QMainWindow):
         enabled_areas = set(enabled_areas_list) if isinstance(enabled_areas_list, list) else set()
 
         # 8192 -> Normalized 변환하여 캐시 저장
-        norm_by_area = {}
-        for aid, pts in data_8192.items():
-            norm_pts = []
-            for x, y in pts:
-                norm_pts.append((x / 8192.0, y / 8192.0))
-            norm_by_area[aid] = norm_pts
+        inv = _ROI_CAM_INV
+        norm_by_area = {aid: [(x * inv, y * inv) for x, y in pts] for aid, pts in data_8192.items()}
             
         self.roi_cache[key] = {
             'norm': norm_by_area,
             'enabled': enabled_areas
         }
+        self._bump_roi_rev(key)
         
         # 오버레이 갱신 시도
         if key in self.tiles:
@@ -857,15 +1064,33 @@ class WindowSum(QMainWindow):
             # 편집 중인 영역은 무조건 보이게 처리 (enabled 목록에 없어도)
             display_enabled = {target_area}
             
+        # 편집 상태는 확대된 카메라가 Edit 모드일 때만 활성화
+        edit_area = None
+        if self.roi_mode == "edit" and camera_key == self.maximized_camera_key:
+            edit_area = self.current_roi_area
+
         video = self.tiles[camera_key]['video']
-        video.set_roi_regions(display_norm, display_enabled)
-        video.set_roi_visible(True)
+
+        # 표시 내용이 마지막 적용분과 같으면 생략 (타일 재생성 시 위젯이 바뀌므로 함께 비교)
+        # 캐시 내용은 좌표를 비교하는 대신 변경 revision으로 판별
+        sig = (self._roi_cache_rev.get(camera_key, 0), self.roi_mode, self.current_roi_area, edit_area)
+        last = self._roi_last_applied.get(camera_key)
+        if last is not None and last[0] is video and last[1] == sig:
+            return
+
+        # 데이터/표시/편집 상태를 한 번에 전달 (repaint 1회)
+        video.apply_roi_state(display_norm, display_enabled, True, edit_area, edit_area is not None)
+        self._roi_last_applied[camera_key] = (video, sig)
         
-        # 검증 로그
-        if self.ui.chk_show_debug.isChecked():
+        # 검증 로그 (DEBUG 체크 + 로거 DEBUG 레벨일 때만 위젯 데이터 복사)
+        if self._debug_enabled and logger.isEnabledFor(logging.DEBUG):
             r_norm, r_en = video.get_roi_regions()
             logger.debug(f"[ROI] Applied to {camera_key} (Mode={self.roi_mode}): areas={list(r_norm.keys())}")
 
+    def _bump_roi_rev(self, camera_key):
+        """roi_cache[camera_key] 변경 표시 (다음 roi_apply_to_video에서 재적용)"""
+        self._roi_cache_rev[camera_key] = self._roi_cache_rev.get(camera_key, 0) + 1
+
     def roi_enter_edit(self, camera_key, area_id):
         """편집 모드 진입: 백업 생성 후 VideoWidget 편집 활성화"""
         if camera_key not in self.tiles: return
@@ -873,6 +1098,7 @@ class WindowSum(QMainWindow):
         # 캐시가 없으면 빈 상태로 초기화
         if camera_key not in self.roi_cache:
             self.roi_cache[camera_key] = {'norm': {}, 'enabled': set()}
+            self._bump_roi_rev(camera_key)
             
         # 백업 생성 (편집 진입 시점의 상태 저장)
         # 이미 백업이 있고 편집 중이라면 덮어쓰지 않음 (Area 전환 시 백업 유지)
@@ -880,11 +1106,16 @@ class WindowSum(QMainWindow):
         # toggle_maximize에서 진입 시 1회 백업하는 것이 좋음.
         # 현재 구조상 toggle_maximize에서 호출되므로, 백업이 없으면 생성.
         if camera_key not in self.roi_backup_cache:
-            import copy
-            self.roi_backup_cache[camera_key] = copy.deepcopy(self.roi_cache[camera_key])
+            # 좌표는 불변 튜플이므로 2단계 얕은 복사로 충분 (deepcopy 재귀 비용 제거)
+            src = self.roi_cache[camera_key]
+            self.roi_backup_cache[camera_key] = {
+                'norm': {aid: list(pts) for aid, pts in src.get('norm', {}).items()},
+                'enabled': set(src.get('enabled', ()))
+            }
 
-        video = self.tiles[camera_key]['video']
-        video.set_roi_edit(area_id, True)
+        # 편집 대상 Area 표시 및 편집 활성화 (roi_mode == "edit" 기준)
+        self.current_roi_area = area_id
+        self.roi_apply_to_video(camera_key)
 
     def roi_exit_edit(self, camera_key, commit=False):
         """편집 모드 종료: 저장(commit) 또는 취소(rollback)"""
@@ -895,14 +1126,15 @@ class WindowSum(QMainWindow):
             if camera_key in self.roi_backup_cache:
                 self.roi_cache[camera_key] = self.roi_backup_cache[camera_key]
                 del self.roi_backup_cache[camera_key]
+                self._bump_roi_rev(camera_key)
         else:
             # 커밋: 백업 삭제 (현재 상태 확정)
             if camera_key in self.roi_backup_cache:
                 del self.roi_backup_cache[camera_key]
         
-        # VideoWidget에 최종 상태 적용 및 편집 모드 해제
-        video = self.tiles[camera_key]['video']
-        video.set_roi_edit(None, False)
+        # VideoWidget에 최종 상태 적용 및 편집 모드 해제 (roi_mode가 edit이 아닌 상태에서 호출됨)
+        # (편집 중 위젯 내부 좌표가 바뀌었을 수 있으므로 캐시 비교 없이 재적용)
+        self._roi_last_applied.pop(camera_key, None)
         self.roi_apply_to_video(camera_key)
 
     def on_roi_save(self):
@@ -910,7 +1142,7 @@ class WindowSum(QMainWindow):
             return
             
         cam_key = self.maximized_camera_key
-        cam = next((c for c in self.cfg_mgr.get_cameras() if c['key'] == cam_key), None)
+        cam = self._camera_by_key.get(cam_key)
         if not cam: return
         
         video = self.tiles[cam_key]['video']
@@ -925,11 +1157,12 @@ class WindowSum(QMainWindow):
             return
         
         # Convert Normalized -> 8192
-        points_8192 = []
-        for nx, ny in points_norm:
-            x = max(0, min(8192, int(nx * 8192.0)))
-            y = max(0, min(8192, int(ny * 8192.0)))
-            points_8192.append((x, y))
+        # 정규화 좌표를 0~1로 클램프 후 스케일 (결과는 0~8192 범위 정수)
+        # min/max 내장 함수 호출 대신 비교식으로 클램프 (좌표당 함수 호출 제거)
+        scale = _ROI_CAM_SCALE
+        points_8192 = [(0 if nx <= 0.0 else scale if nx >= 1.0 else int(nx * scale),
+                        0 if ny <= 0.0 else scale if ny >= 1.0 else int(ny * scale))
+                       for nx, ny in points_norm]
             
         # Find Rule Index & Set
         rule_idx = cgi_client.get_rule_index_for_area(cam['ip'], cam['username'], cam['password'], self.current_roi_area)
@@ -943,7 +1176,8 @@ class WindowSum(QMainWindow):
         if ok:
             # 1. 캐시 업데이트 (현재 편집된 좌표를 캐시에 반영)
             if cam_key in self.roi_cache:
-                self.roi_cache[cam_key]['norm'][self.current_roi_area] = list(points_norm)
+                self.roi_cache[cam_key]['norm'][self.current_roi_area] = points_norm # get_roi_edit_points_norm은 새 리스트 반환
+                self._bump_roi_rev(cam_key)
             
             # 2. 모드 전환 (View) 및 편집 종료 (Commit)
             # 저장 성공 시 View 모드로 복귀하며 전체 ROI를 표시해야 함
@@ -971,13 +1205,9 @@ class WindowSum(QMainWindow):
         last_camera_key = self.state_mgr.get("last_camera_key")
         if last_camera_key:
             # 리스트 선택 복원 (이벤트 발생 -> 하이라이트 처리됨)
-            items = self.ui.camera_list.findItems(last_camera_key, Qt.MatchFlag.MatchContains) # MatchContains is loose, but key is in UserRole
-            # UserRole 검색이 정확하므로 순회
-            for i in range(self.ui.camera_list.count()):
-                item = self.ui.camera_list.item(i)
-                if item.data(Qt.UserRole) == last_camera_key:
-                    self.ui.camera_list.setCurrentItem(item)
-                    break
+            item = self._key_to_list_item.get(last_camera_key)
+            if item is not None:
+                self.ui.camera_list.setCurrentItem(item)
         
         # 앱 시작 시 자동 재생 (옵션)
         # Windows UX: 앱 시작 시에는 모니터링 자동 시작 안 함 (사용자가 Start 눌러야 함)
@@ -998,8 +1228,7 @@ class WindowSum(QMainWindow):
             # 타일 강조 (1121 스타일: 영상 타일 선택 표시 안 함)
             
             # 우측 정보 패널 채우기
-            cameras = self.cfg_mgr.get_cameras()
-            cam = next((c for c in cameras if c['key'] == camera_key), None)
+            cam = self._camera_by_key.get(camera_key)
             if cam:
                 self.ui.edit_name.setText(cam.get('name', ''))
                 self.ui.edit_ip.setText(cam.get('ip', ''))
@@ -1017,38 +1246,48 @@ class WindowSum(QMainWindow):
     def get_selected_monitor_cameras(self):
         """체크된 모니터링 대상 카메라 목록 반환"""
         selected = []
-        all_cameras = self.cfg_mgr.get_cameras()
-        
-        # UI 리스트 위젯을 순회하며 체크 상태 확인
-        for i in range(self.ui.camera_list.count()):
-            item = self.ui.camera_list.item(i)
-            widget = self.ui.camera_list.itemWidget(item)
-            if widget and hasattr(widget, 'chk_monitor') and widget.chk_monitor.isChecked():
-                key = item.data(Qt.UserRole)
-                cam = next((c for c in all_cameras if c['key'] == key), None)
-                if cam:
-                    selected.append(cam)
+        
+        # 카메라 항목 위젯 맵으로 체크 상태 확인 (리스트와 같은 설정 순서)
+        for key, cam in self._camera_by_key.items():
+            widget = self.camera_items.get(key)
+            if widget is not None and widget.chk_monitor.isChecked():
+                selected.append(cam)
         return selected
 
     def on_tab_changed(self, index):
         """탭 변경 시 호출"""
-        # Monitoring 탭(인덱스 1)으로 진입 시 레이아웃 리셋
-        if index == 1:
+        # Monitoring 탭으로 진입 시 레이아웃 리셋
+        if index == self.ui.tabs.indexOf(self.ui.tab_monitoring):
             self.reset_video_grid_layout("TabEnter_Monitoring")
+            # 다른 탭에 있는 동안 미뤄둔 모니터링 표 갱신 반영 (기간 집계도 최신으로 재조회)
+            self._expire_table_rows()
+            self.update_monitoring_tables()
 
     def on_btn_start_clicked(self):
         """모니터링 시작: 체크된 카메라만 수집하여 시작"""
-        if getattr(self, "_starting_monitor", False):
+        if self._starting_monitor:
             return
         self._starting_monitor = True
 
-        try:
-            # [Critical Stability Patch] 확대 상태 완전 해제 (GStreamer 안정화)
-            if self.is_video_maximized and self.maximized_camera_key:
+        # [Critical Stability Patch] 확대 상태 완전 해제 (GStreamer 안정화)
+        # 안정화 대기(200ms)는 이벤트 루프를 막지 않도록 타이머로 이어서 처리
+        if self.is_video_maximized and self.maximized_camera_key:
+            try:
                 self.toggle_maximize_video(self.maximized_camera_key)
-                QApplication.processEvents()
-                time.sleep(0.2)
-            
+            except Exception:
+                self._starting_monitor = False
+                raise
+            QTimer.singleShot(200, self._start_monitoring_stage2)
+            return
+
+        self._start_monitoring_stage2()
+
+    def _start_monitoring_stage2(self):
+        """모니터링 시작 2단계: 스트림 정리 후 대상 카메라로 그리드 구성 (종료 시 시작 가드 해제)"""
+        try:
+            if self._closing:
+                return
+
             # 안전을 위해 한번 더 처리
             QApplication.processEvents()
 
@@ -1070,12 +1309,14 @@ class WindowSum(QMainWindow):
             
             self.rebuild_grid(target_cameras)
             # self.start_all_streams() # [CRITICAL FIX v3] rebuild_grid 내부(지연 실행)로 이동됨
-            self.ui.tabs.setCurrentIndex(1) # 모니터링 탭으로 이동
+            self.ui.tabs.setCurrentWidget(self.ui.tab_monitoring) # 모니터링 탭으로 이동
             
-            # ROI 데이터 비동기 로드 시작
+            # ROI 데이터 비동기 로드 시작 (이미 로드 중인 카메라는 진행 중인 결과를 그대로 사용)
             self.roi_cache.clear()
-            for cam in target_cameras:
-                worker = RoiLoadWorker(cam['key'], cam['ip'], cam['username'], cam['password'])
+            load_cameras = [cam for cam in target_cameras if cam['key'] not in self._roi_load_inflight]
+            if load_cameras:
+                self._roi_load_inflight.update(cam['key'] for cam in load_cameras)
+                worker = RoiLoadWorker(load_cameras)
                 worker.signals.result.connect(self.on_roi_loaded)
                 self.threadpool.start(worker)
         finally:
@@ -1095,14 +1336,11 @@ class WindowSum(QMainWindow):
         # [수정] 이벤트 스레드는 유지 (영상만 정지, 이벤트 수신/DB 저장은 계속)
         # self.stop_events() 호출 제거
 
-        for i in range(self.ui.camera_list.count()):
-            item = self.ui.camera_list.item(i)
-            widget = self.ui.camera_list.itemWidget(item)
-            if widget and hasattr(widget, 'chk_monitor'):
-                # 시그널 차단하여 불필요한 개별 저장 방지 (이미 clear_all 했으므로)
-                widget.chk_monitor.blockSignals(True)
-                widget.chk_monitor.setChecked(False)
-                widget.chk_monitor.blockSignals(False)
+        for widget in self.camera_items.values():
+            # 시그널 차단하여 불필요한 개별 저장 방지 (이미 clear_all 했으므로)
+            widget.chk_monitor.blockSignals(True)
+            widget.chk_monitor.setChecked(False)
+            widget.chk_monitor.blockSignals(False)
         
         # [Commit M2-3] Stop 시 Keep Watching 리셋 (자동 종료 방지 옵션 해제)
         if self.ui.chk_keep_watching.isChecked():
@@ -1112,7 +1350,7 @@ class WindowSum(QMainWindow):
 
         self.update_status_bar()
         
-        self.ui.tabs.setCurrentIndex(0) # 설정 탭으로 이동
+        self.ui.tabs.setCurrentWidget(self.ui.tab_settings) # 설정 탭으로 이동
 
     def on_btn_add_clicked(self):
         info = {
@@ -1153,6 +1391,9 @@ class WindowSum(QMainWindow):
         if key in self.discovered_areas: del self.discovered_areas[key]
         if key in self.camera_conn_status: del self.camera_conn_status[key]
         if key in self.camera_items: del self.camera_items[key]
+        self._key_to_list_item.pop(key, None)
+        self._prev_cam_snapshots.pop(key, None)
+        self._camera_by_key.pop(key, None)
         
         # UI 리스트에서 즉시 제거
         row = self.ui.camera_list.row(current)
@@ -1164,7 +1405,8 @@ class WindowSum(QMainWindow):
         self.state_mgr.cleanup_camera_state(key)
         
         # 테이블 즉시 갱신 (삭제된 카메라가 안 나오도록)
-        self.ui_dirty = True
+        self._row_values_cache.pop(key, None)
+        self._tables_stale = True
         self.update_monitoring_tables()
 
         # 입력창 초기화
@@ -1181,9 +1423,8 @@ class WindowSum(QMainWindow):
         # 1. 영상 재생
         for tile_data in self.tiles.values():
             video = tile_data['video']
-            layout = tile_data['layout']
             
-            layout.setCurrentIndex(0)  # 영상 표시
+            self._set_tile_stopped(tile_data, False)  # 영상 표시
             try:
                 video.play()
             except Exception as e:
@@ -1201,7 +1442,7 @@ class WindowSum(QMainWindow):
 
         count = 0
         # 타일(영상) 여부와 상관없이 모든 설정된 카메라에 대해 이벤트 수집
-        cameras = self.cfg_mgr.get_cameras()
+        cameras = self._camera_by_key.values()
         
         for cam_cfg in cameras:
             key = cam_cfg['key']
@@ -1256,10 +1497,9 @@ class WindowSum(QMainWindow):
         # 영상 정지
         for tile_data in self.tiles.values():
             video = tile_data['video']
-            layout = tile_data['layout']
             
             video.stop()
-            layout.setCurrentIndex(1)  # STOPPED 라벨 표시
+            self._set_tile_stopped(tile_data, True)  # STOPPED 라벨 표시
 
     def stop_events(self):
         """모든 이벤트 스레드 중지"""
@@ -1294,13 +1534,9 @@ class WindowSum(QMainWindow):
         self.discovered_areas[camera_key].add(area_id)
 
         # CameraListItem의 라벨 업데이트
-        for i in range(self.ui.camera_list.count()):
-            item = self.ui.camera_list.item(i)
-            if item.data(Qt.UserRole) == camera_key:
-                widget = self.ui.camera_list.itemWidget(item)
-                if widget:
-                    widget.update_area_count(len(self.discovered_areas[camera_key]))
-                break
+        widget = self.camera_items.get(camera_key)
+        if widget is not None:
+            widget.update_area_count(len(self.discovered_areas[camera_key]))
 
     @Slot(str, int, bool)
     def on_card_area_changed(self, camera_key, area_id, checked):
@@ -1326,7 +1562,7 @@ class WindowSum(QMainWindow):
         if evt_type == "DEBUG":
             # DEBUG 로그는 DB 저장 생략 (필요시 주석 해제)
             # db_module.enqueue_event(event_data) 
-            if not self.ui.chk_show_debug.isChecked():
+            if not self._debug_enabled:
                 return
                 
 
@@ -1349,27 +1585,32 @@ class WindowSum(QMainWindow):
         area_id = event_data.get('area_id')
         current_count = event_data.get('count')
         
-        # 1. 캐시 초기화 및 조회
-        if cam_key not in self._last_people_total:
-            self._last_people_total[cam_key] = {}
+        # 1. 캐시 초기화 및 조회 (카메라별 내부 dict를 지역 변수로 확보)
+        last_by_area = self._last_people_total.setdefault(cam_key, {})
         
         # 유효성 검사
         if current_count is None or current_count < 0:
             return
 
-        last_total = self._last_people_total[cam_key].get(area_id)
+        last_total = last_by_area.get(area_id)
+
+        # 값 변화 없음 (대부분의 이벤트): 실시간 카운트/DB/GPIO는 이미 최신이므로 생략
+        # LED만 동기화 (카드 위젯 재생성/연결 복구 후 복원용, 상태 동일 시 내부에서 생략됨)
+        if current_count == last_total:
+            widget = self.camera_items.get(cam_key)
+            if widget is not None:
+                widget.set_area_count(area_id, current_count)
+            return
         
-        # 2. UI 실시간 카운트 갱신 (항상 수행)
-        if cam_key not in self.realtime_counts:
-            self.realtime_counts[cam_key] = {}
-        self.realtime_counts[cam_key][area_id] = current_count
-        self.ui_dirty = True
+        # 2. UI 실시간 카운트 갱신
+        self.realtime_counts.setdefault(cam_key, {})[area_id] = current_count
+        self._dirty_rows.add(cam_key)
         
         # 최초 수신(None)이면 트리거/DB기록 없이 리턴 (기준점 설정)
         if last_total is None:
-            self._last_people_total[cam_key][area_id] = current_count
+            last_by_area[area_id] = current_count
             # [Commit 23-1] Init 이벤트는 DB에 저장하지 않음 (기준점만 설정)
-            if self.ui.chk_show_debug.isChecked():
+            if self._debug_enabled:
                 self.add_event_log(f"[DEBUG] [{cam_key}] Area {area_id} People Init ({current_count}) - Not saved to DB")
             return
 
@@ -1381,27 +1622,25 @@ class WindowSum(QMainWindow):
             event_data['count'] = current_count
             event_data['delta'] = delta # [Commit 22-2] 명시적 delta 전달
             
-            # 메시지 생성
+            # 메시지 생성 (감소 이벤트는 DB에 저장되지 않고 UI 로그도 없으므로 생략)
             if delta > 0:
                 event_data['message'] = f"[{cam_key}] Area {area_id} People +{delta} ({current_count})"
-            else:
-                event_data['message'] = f"[{cam_key}] Area {area_id} People {delta} ({current_count})"
             
             db_module.enqueue_event(event_data)
             
             # UI 로그 (증가 시에만, 쿨다운 적용)
             if delta > 0:
                 state_key = (cam_key, area_id)
-                now = time.time()
-                last_emit_ts = self.last_event_timestamps.get(state_key, 0)
+                now = time.monotonic_ns()
+                last_emit_ts = self.last_event_timestamps.get(state_key)
                 
-                if (now - last_emit_ts) >= self.event_cooldown_sec:
+                if last_emit_ts is None or (now - last_emit_ts) >= self._event_cooldown_ns:
                     self.last_event_timestamps[state_key] = now
                     self.add_event_log(event_data['message'])
                     self.total_events += 1
-                    self.update_status_bar()
+                    self._request_status_update()
                     
-                    if self.ui.chk_show_debug.isChecked():
+                    if self._debug_enabled:
                         self.add_event_log(f"[DEBUG] PEOPLE {cam_key} A{area_id} raw={current_count} prev={last_total} delta={delta}")
 
         # 5. GPIO 트리거 (Windows 규칙)
@@ -1421,11 +1660,12 @@ class WindowSum(QMainWindow):
                     self.gpio_bridge.trigger_pulse(int(area_id))
 
         # 7. UI LED 업데이트 (카메라 카드)
-        if cam_key in self.camera_items:
-            self.camera_items[cam_key].set_area_count(area_id, current_count)
+        widget = self.camera_items.get(cam_key)
+        if widget is not None:
+            widget.set_area_count(area_id, current_count)
             
         # 6. 캐시 업데이트
-        self._last_people_total[cam_key][area_id] = current_count
+        last_by_area[area_id] = current_count
 
     def _handle_stay_alarm(self, event_data):
         """StayDetection 이벤트 처리 (Windows 규칙 적용)"""
@@ -1455,36 +1695,35 @@ class WindowSum(QMainWindow):
         if action == 'Start':
             state_key = (cam_key, area_id)
             cooldown_key = (cam_key, area_id, action)
-            now = time.time()
+            now = time.monotonic_ns()
 
             # 로그/DB 기록 (쿨다운 적용)
-            last_emit = self.stay_last_emit.get(cooldown_key, 0)
-            if (now - last_emit) >= self.stay_cooldown_sec:
+            last_emit = self.stay_last_emit.get(cooldown_key)
+            if last_emit is None or (now - last_emit) >= self._stay_cooldown_ns:
                 msg = f"체류 감지 이벤트 수신: {cam_key} Area {area_id} Action:Start"
                 event_data['message'] = msg
                 db_module.enqueue_event(event_data)
                 self.add_event_log(msg)
                 self.total_events += 1
-                self.update_status_bar()
+                self._request_status_update()
                 self.stay_last_emit[cooldown_key] = now
 
             # 상태 변경 (항상 True)
             self.stay_states[state_key] = True
 
-            # 자동 해제 타이머 설정
-            if state_key in self._stay_clear_timers:
-                self._stay_clear_timers[state_key].stop()
-            
-            timer = QTimer(self)
-            timer.setSingleShot(True)
-            # lambda를 사용하여 인자 전달
-            timer.timeout.connect(lambda sk=state_key: self._clear_stay_state(sk[0], sk[1]))
+            # 자동 해제 타이머 설정 (키별 타이머를 최초 1회만 생성, 이후 start()로 재시작)
+            timer = self._stay_clear_timers.get(state_key)
+            if timer is None:
+                timer = QTimer(self)
+                timer.setSingleShot(True)
+                # lambda를 사용하여 인자 전달
+                timer.timeout.connect(lambda sk=state_key: self._clear_stay_state(sk[0], sk[1]))
+                self._stay_clear_timers[state_key] = timer
             timer.start(self.stay_hold_ms)
-            self._stay_clear_timers[state_key] = timer
 
     def _get_camera_ip(self, key):
         """카메라 키로 IP 조회"""
-        cam = next((c for c in self.cfg_mgr.get_cameras() if c['key'] == key), None)
+        cam = self._camera_by_key.get(key)
         return cam['ip'] if cam else "Unknown"
 
     @Slot(str, int)
@@ -1494,20 +1733,26 @@ class WindowSum(QMainWindow):
         if self.stay_states.get(state_key, False):
             self.stay_states[state_key] = False
             # UI/DB에 기록하지 않음 (노이즈 제거)
-            # 타이머 객체 참조 제거
-            if state_key in self._stay_clear_timers:
-                del self._stay_clear_timers[state_key]
+            # 타이머는 다음 Start에서 재사용하므로 유지
 
     def _check_gpio_debounce(self, cam_key, area_id, event_type, debounce_sec=0.3):
         """GPIO 중복 트리거 방지 (짧은 디바운스)"""
         key = (cam_key, area_id, event_type)
-        now = time.time()
-        last_ts = self.gpio_last_trigger_ts.get(key, 0)
-        if (now - last_ts) < debounce_sec:
+        now = time.monotonic_ns()
+        last_ts = self.gpio_last_trigger_ts.get(key)
+        if last_ts is not None and (now - last_ts) < int(debounce_sec * 1_000_000_000):
             return False
         self.gpio_last_trigger_ts[key] = now
         return True
 
+    def _prune_debounce_tables(self):
+        """만료된 쿨다운/디바운스 기록 정리"""
+        cutoff = time.monotonic_ns() - self._debounce_prune_ns
+        for table in (self.last_event_timestamps, self.stay_last_emit, self.gpio_last_trigger_ts):
+            stale = [k for k, ts in table.items() if ts < cutoff]
+            for k in stale:
+                del table[k]
+
     def on_gpio_test_clicked(self):
         """GPIO 테스트 버튼 클릭 시 Area 1 (GPIO 17) 펄스 발생"""
         try:
@@ -1534,7 +1779,7 @@ class WindowSum(QMainWindow):
 
     def _update_gpio_status_ui(self):
         """GPIO 연결 상태 라벨 갱신"""
-        if not hasattr(self.ui, 'lbl_gpio_status'): return
+        if self.ui.lbl_gpio_status is None: return
         
         if not self.gpio_bridge.has_gpio:
              self.ui.lbl_gpio_status.setText("GPIO: Mock (No HW)")
@@ -1550,20 +1795,12 @@ class WindowSum(QMainWindow):
 
     def add_gpio_log(self, msg):
         """GPIO 전용 로그 박스에 메시지 추가"""
-        if not hasattr(self.ui, 'gpio_text') or not self.ui.gpio_text:
+        if self.ui.gpio_text is None:
             return
-        
-        # [수정] 스크롤바가 맨 아래에 있는지 확인 (오차 범위 10px)
-        scrollbar = self.ui.gpio_text.verticalScrollBar()
-        was_at_bottom = scrollbar.value() >= (scrollbar.maximum() - 10)
 
         ts = time.strftime("%H:%M:%S")
-        log_line = f"[{ts}] {msg}"
-        self.ui.gpio_text.append(log_line)
-        
-        # [수정] 사용자가 맨 아래를 보고 있었을 때만 자동 스크롤
-        if was_at_bottom:
-            scrollbar.setValue(scrollbar.maximum())
+        # appendPlainText는 맨 아래를 보고 있을 때만 자동 스크롤 (위로 올려 보는 중이면 위치 유지)
+        self.ui.gpio_text.appendPlainText(f"[{ts}] {msg}")
 
     def on_area_item_changed(self, item, column):
         """Area 체크박스 상태 변경 시 호출"""
@@ -1575,11 +1812,13 @@ class WindowSum(QMainWindow):
                         
             self.state_mgr.set_area_enabled(camera_key, area_id, is_checked)
 
+    @Slot(str)
     def add_event_log(self, msg, ts=None, write_file_log=True):
         """로그 리스트에 추가하고 최대 개수 유지"""
+        # DEBUG 분류는 1회만 수행 (UI 필터링 + 파일 로그 분기에서 재사용)
+        is_debug = msg.startswith("[DEBUG]")
         # DEBUG 필터링 (UI 표시용)
-        if msg.startswith("[DEBUG]") and not self.ui.chk_show_debug.isChecked():
-
+        if is_debug and not self._debug_enabled:
             return
 
         if ts is None:
@@ -1590,44 +1829,39 @@ class WindowSum(QMainWindow):
         if len(ts) > 10 and ' ' in ts:
             display_ts = ts.split(' ')[1]
             
-        # [수정] 스크롤바가 맨 아래에 있는지 확인 (오차 범위 10px)
-        scrollbar = self.ui.list_events.verticalScrollBar()
-        was_at_bottom = scrollbar.value() >= (scrollbar.maximum() - 10)
-
-        item = QListWidgetItem(f"[{display_ts}] {msg}")
-        
-        # 알람 종류에 따라 색상 (선택)
-        if "ALARM" in msg:
-            item.setForeground(Qt.GlobalColor.red)
-            
-        # [수정] 최신 로그를 아래에 추가 (append)
-        self.ui.list_events.addItem(item)
-        
-        # [수정] 최대 개수 초과 시 가장 오래된(맨 위) 항목 제거
-        while self.ui.list_events.count() > 200:
-            self.ui.list_events.takeItem(0)
-            
-        # [수정] 사용자가 맨 아래를 보고 있었을 때만 자동 스크롤
-        if was_at_bottom:
-            self.ui.list_events.scrollToBottom()
+        # 화면 반영은 _flush_event_log에서 모아서 처리 (ALARM은 빨간색 표시)
+        self._pending_log.append((f"[{display_ts}] {msg}", "ALARM" in msg))
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
             
         # 시스템 로그에도 기록 (DEBUG 레벨)
         if write_file_log:
             # [Commit REC-5] GUI_LOG rate-limit + 중요도 분리
-            if msg.startswith("[DEBUG]"):
+            if is_debug:
+                # 한산할 때는 건수만 세고 바로 기록 (폭주 시에만 템플릿/해시 기반 억제)
+                now = time.monotonic_ns()
+                if now - self._debug_window_start > _GUI_DEBUG_WINDOW_NS:
+                    self._debug_window_start = now
+                    self._debug_window_count = 0
+                self._debug_window_count += 1
+                if self._debug_window_count < _GUI_DEBUG_FAST_LIMIT:
+                    logger.debug(f"[GUI_LOG] {msg}")
+                    return
+
                 # [FIX] 메시지 템플릿 기반 키 생성 (뭉개짐 방지)
                 context_key = "global"
-                match = re.search(r'(?:camera[=\s]|\[)(camera\d+)', msg)
+                match = _RE_LOG_CAMERA.search(msg)
                 if match:
                     context_key = match.group(1)
                 
-                # 숫자를 #으로 치환하여 메시지 템플릿 생성
-                template = re.sub(r'\d', '#', msg)
-                template_hash = hashlib.sha1(template.encode('utf-8')).hexdigest()[:8]
+                # 숫자를 #으로 치환하여 메시지 템플릿 생성 (translate: 정규식 엔진 없이 C 루프)
+                # 프로세스 내 중복 판별 키이므로 암호학적 해시 대신 내장 hash() 사용
+                template_hash = hash(msg.translate(_LOG_DIGIT_TABLE))
 
                 rate_limit_key = f"gui_log_{context_key}_{template_hash}"
 
-                allow, suppressed = should_log(rate_limit_key, 10)
+                # 토큰 버킷: 순간 5건까지 허용, 장기적으로는 10초당 1건
+                allow, suppressed = allow_burst(rate_limit_key, 0.1, 5)
                 if allow:
                     suffix = f" (suppressed {suppressed})" if suppressed > 0 else ""
                     logger.debug(f"[GUI_LOG] {msg}{suffix}")
@@ -1635,6 +1869,24 @@ class WindowSum(QMainWindow):
                 # 중요 메시지([Main], [System] 등)는 제한 없이 기록
                 logger.debug(f"[GUI_LOG] {msg}")
 
+    def _flush_event_log(self):
+        """대기 중인 로그를 리스트 모델에 한 번에 추가"""
+        if not self._pending_log:
+            return
+        rows, self._pending_log = self._pending_log, []
+
+        # [수정] 스크롤바가 맨 아래에 있는지 확인 (오차 범위 10px)
+        scrollbar = self.ui.list_events.verticalScrollBar()
+        was_at_bottom = scrollbar.value() >= (scrollbar.maximum() - 10)
+
+        # [수정] 최신 로그를 아래에 추가 (append)
+        # 최대 개수(200) 초과 시 가장 오래된(맨 위) 항목은 모델에서 제거됨
+        self.ui.event_log_model.extend_rows(rows)
+
+        # [수정] 사용자가 맨 아래를 보고 있었을 때만 자동 스크롤
+        if was_at_bottom:
+            self.ui.list_events.scrollToBottom()
+
     def load_recent_events(self):
         """DB에서 최근 이벤트를 불러와 UI에 표시"""
 
@@ -1655,8 +1907,8 @@ class WindowSum(QMainWindow):
     def reload_recent_events_filter(self, state):
         """DEBUG 체크박스 변경 시 리스트 갱신"""
 
-
-        self.ui.list_events.clear()
+        self._pending_log.clear()
+        self.ui.event_log_model.clear()
         # 현재 메모리에 있는 로그를 다시 필터링해서 보여주는 것이 아니라,
         # DB에서 다시 로드하여 필터를 적용함
         self.load_recent_events()
@@ -1671,16 +1923,16 @@ class WindowSum(QMainWindow):
         selected_cam = current.data(Qt.UserRole) if current else None
         
         # 스트리밍 상태 확인 (하나라도 재생 중이면 ON)
-        is_streaming = "OFF"
-        for tile_data in self.tiles.values():
-            widget = tile_data['video']
-            if widget.is_ready and widget.is_playing():
-                is_streaming = "ON"
-                break
+        is_streaming = "ON" if self._playing_keys else "OFF"
 
         msg = f"Cameras: {cam_count} | Split: {split_mode} | Streaming: {is_streaming} | Events: {self.total_events}"
         self.ui.status_bar.showMessage(msg)
 
+    def _request_status_update(self):
+        """상태바 갱신 예약 (이미 예약되어 있으면 병합)"""
+        if not self._status_refresh_timer.isActive():
+            self._status_refresh_timer.start()
+
     def _set_html_keep_scroll(self, widget, html):
         """HTML을 설정하되 스크롤 위치를 유지합니다."""
         scrollbar = widget.verticalScrollBar()
@@ -1689,122 +1941,171 @@ class WindowSum(QMainWindow):
         
         widget.setHtml(html)
         
-        # 내용이 변경되어 스크롤 범위가 바뀔 수 있으므로 처리
-        if is_at_bottom:
-            scrollbar.setValue(scrollbar.maximum())
-        else:
-            scrollbar.setValue(min(current_value, scrollbar.maximum()))
+        # 내용이 변경되어 스크롤 범위가 바뀔 수 있으므로 처리 (갱신된 maximum은 1회만 조회)
+        new_max = scrollbar.maximum()
+        scrollbar.setValue(new_max if is_at_bottom else min(current_value, new_max))
+
+    def _expire_table_rows(self):
+        """모든 카메라 행을 재조회 대상으로 표시 (기간 집계 만료 반영)"""
+        self._dirty_rows.update(self._camera_by_key)
 
     def update_monitoring_tables(self):
-        """모니터링 탭의 표(집계/실시간)를 갱신합니다."""
-        if not self.ui_dirty:
+        """모니터링 탭의 표(집계/실시간)를 갱신합니다. (변경된 카메라 행만 재생성)"""
+        if not self._dirty_rows and not self._tables_stale:
+            return
+        # 표가 보이지 않는 동안(다른 탭)은 변경 표시만 유지하고 Monitoring 탭 진입 시 갱신
+        if self.ui.tabs.currentIndex() != self.ui.tabs.indexOf(self.ui.tab_monitoring):
             return
             
-        cameras = self.cfg_mgr.get_cameras()
+        cameras = self._camera_by_key.values()
         if not cameras:
             return
 
-        # 1121 스타일 (monitoring_manager.py / config_module.py get_css_classes 참조)
-        style = """
-        <style>
-        .table-header { 
-            border: 1px solid #cccccc; padding: 2px 4px; text-align: center; 
-            font-weight: 600; background-color: #f0f0f0; color: #333333; font-size: 11px;
-        }
-        .table-cell-left { 
-            border: 1px solid #cccccc; padding: 2px 4px; text-align: left; 
-            font-weight: 500; color: #333333; background-color: white; font-size: 11px;
-        }
-        .table-cell-center { 
-            border: 1px solid #cccccc; padding: 2px 4px; text-align: center; 
-            font-weight: 500; color: #333333; background-color: white; font-size: 11px;
-        }
-        </style>
-        """
-        
-        # 1. People Count Summary (DB 집계)
-        sum_html = style + '<table width="100%" cellspacing="0" cellpadding="0" style="border-collapse: collapse;">'
-        # 헤더: 카메라 정보 + Area 1~4 (총 5열)
-        sum_html += '<tr><th class="table-header" style="width:300px;">카메라 정보</th>'
-        for i in range(4):
-            sum_html += f'<th class="table-header">Area {i+1}</th>'
-        sum_html += '</tr>'
-        
-        for cam in cameras:
+        # 변경된(또는 캐시에 없는) 카메라 행만 재계산 - 나머지는 DB 집계 재조회 없이 재사용
+        # 카메라 구성/라벨이 그대로면 setHtml(문서 재파싱/레이아웃) 대신 바뀐 셀 텍스트만 교체
+        structure_changed = self._tables_stale or self._sum_table is None or self._rt_table is None
+        changed_keys = []
+        rebuild = [cam for cam in cameras if cam['key'] in self._dirty_rows or cam['key'] not in self._row_values_cache]
+        # 재계산 대상 카메라의 기간 x Area 집계 격자를 1회 쿼리로 조회 (표 셀 순서 그대로)
+        grid_by_key = db_module.get_people_count_grid_multi([cam['key'] for cam in rebuild], _TABLE_PERIOD_HOURS) if rebuild else {}
+        # 루프 내 self 속성 조회 대신 지역 변수로 1회 바인딩 (두 dict 모두 GUI 스레드에서만 갱신되므로 복사 불필요)
+        conn_status = self.camera_conn_status
+        realtime_counts = self.realtime_counts
+        for cam in rebuild:
             key = cam['key']
-            name = cam.get('name', '')
-            ip = cam.get('ip', '')
-            label_text = f"{ip} / {name}" if name else ip
-            is_connected = self.camera_conn_status.get(key, False)
-            
-            # 카메라 정보 행 (colspan=5)
-            sum_html += f'<tr><td colspan="5" class="table-cell-left" style="font-weight:bold;">{label_text}</td></tr>'
-            
-            # 기간별 집계 (1h, 24h, Total)
-            periods = [("1시간", 1), ("24시간", 24), ("전체", None)]
-            for label, hours in periods:
-                stats = db_module.get_people_count_stats(key, hours)
-                sum_html += f'<tr><td class="table-cell-left">{label}</td>'
-                for i in range(4):
-                    aid = i + 1
-                    # [정책] 연결됨: 값 표시 / 연결안됨: 숨김('-')
-                    if is_connected:
-                        val = stats.get(aid, 0)
-                    else:
-                        val = "-"
-                    sum_html += f'<td class="table-cell-center">{val}</td>'
-                sum_html += '</tr>'
-        sum_html += '</table>'
-        
-        # 2. Realtime Count (메모리 캐시)
-        rt_html = style + '<table width="100%" cellspacing="0" cellpadding="0" style="border-collapse: collapse;">'
-        # 헤더: Area 1~4 (총 4열) - 1121 Realtime 표는 카메라 정보 헤더가 없음
-        rt_html += '<tr>'
-        for i in range(4):
-            rt_html += f'<th class="table-header" style="width:90px;">Area {i+1}</th>'
-        rt_html += '</tr>'
+            values = self._build_camera_row_values(cam, grid_by_key.get(key, _EMPTY_SUM_GRID), conn_status.get(key, False), realtime_counts.get(key, {}))
+            prev = self._row_values_cache.get(key)
+            if values != prev:
+                if prev is None or prev[0] != values[0] or key not in self._table_row_index:
+                    structure_changed = True
+                self._row_values_cache[key] = values
+                changed_keys.append(key)
+        self._dirty_rows.clear()
+        self._tables_stale = False
+        if not structure_changed:
+            if changed_keys:
+                self._update_table_cells(changed_keys)
+            return
         
-        for cam in cameras:
-            key = cam['key']
-            name = cam.get('name', '')
-            ip = cam.get('ip', '')
-            label_text = f"{ip} / {name}" if name else ip
-            is_connected = self.camera_conn_status.get(key, False)
-            
-            # 카메라 정보 행 (colspan=4)
-            rt_html += f'<tr><td colspan="4" class="table-cell-left" style="font-weight:bold;">{label_text}</td></tr>'
-            rt_html += '<tr>'
-            
-            cam_counts = self.realtime_counts.get(key, {})
-            for i in range(4):
-                aid = i + 1
-                # [정책] 연결됨: 값 표시 / 연결안됨: 숨김('-')
-                if is_connected:
-                    val = cam_counts.get(aid, 0)
-                else:
-                    val = "-"
-                rt_html += f'<td class="table-cell-center">{val}</td>'
-            rt_html += '</tr>'
-        rt_html += '</table>'
+        # 1. People Count Summary (DB 집계) / 2. Realtime Count (메모리 캐시)
+        # 스타일/헤더는 고정 문자열 - 조각을 리스트에 모아 1회 join
+        sum_parts = [_SUM_TABLE_HEAD]
+        rt_parts = [_RT_TABLE_HEAD]
 
-        # UI 업데이트 (스크롤 유지 로직은 생략하고 단순 갱신)
-        self._set_html_keep_scroll(self.ui.people_summary, sum_html)
-        self._set_html_keep_scroll(self.ui.personnel_count_label, rt_html)
-        
-        self.ui_dirty = False
+        cell = _TABLE_CELL_CENTER
+        self._table_row_index = {}
+        for idx, cam in enumerate(cameras):
+            key = cam['key']
+            label_text, sum_values, rt_values = self._row_values_cache[key]
+            self._table_row_index[key] = idx
+            # 집계 표: 카메라 정보 행 (colspan=5) + 기간별 집계 (1h, 24h, Total)
+            sum_parts.append(f'<tr><td colspan="5" class="table-cell-left" style="font-weight:bold;">{label_text}</td></tr>')
+            for (label, _hours), vals in zip(_TABLE_PERIODS, sum_values):
+                sum_parts.append(f'<tr><td class="table-cell-left">{label}</td>')
+                sum_parts.extend(cell.format(v) for v in vals)
+                sum_parts.append('</tr>')
+            # 실시간 표: 카메라 정보 행 (colspan=4) + 카운트 행
+            rt_parts.append(f'<tr><td colspan="4" class="table-cell-left" style="font-weight:bold;">{label_text}</td></tr><tr>')
+            rt_parts.extend(cell.format(v) for v in rt_values)
+            rt_parts.append('</tr>')
+        sum_parts.append('</table>')
+        rt_parts.append('</table>')
+        sum_html = ''.join(sum_parts)
+        rt_html = ''.join(rt_parts)
+
+        # UI 업데이트 (중간 repaint 억제)
+        self.ui.people_summary.setUpdatesEnabled(False)
+        self.ui.personnel_count_label.setUpdatesEnabled(False)
+        try:
+            self._set_html_keep_scroll(self.ui.people_summary, sum_html)
+            self._set_html_keep_scroll(self.ui.personnel_count_label, rt_html)
+        finally:
+            self.ui.people_summary.setUpdatesEnabled(True)
+            self.ui.personnel_count_label.setUpdatesEnabled(True)
+        # 이후 틱의 셀 단위 갱신용 표 핸들 (setHtml마다 문서가 새로 만들어지므로 다시 찾음)
+        self._sum_table = self._find_text_table(self.ui.people_summary.document())
+        self._rt_table = self._find_text_table(self.ui.personnel_count_label.document())
+
+    @staticmethod
+    def _find_text_table(document):
+        """문서 루트 프레임에서 첫 번째 QTextTable을 찾습니다."""
+        for frame in document.rootFrame().childFrames():
+            table = frame.firstCursorPosition().currentTable()
+            if table is not None:
+                return table
+        return None
+
+    @staticmethod
+    def _set_table_cell_text(table, row, col, text):
+        """표 셀의 텍스트만 교체합니다. (셀의 기존 글자 서식 유지)"""
+        cell = table.cellAt(row, col)
+        if not cell.isValid():
+            return
+        cursor = cell.firstCursorPosition()
+        fmt = cursor.charFormat()
+        cursor.setPosition(cell.lastCursorPosition().position(), QTextCursor.KeepAnchor)
+        cursor.insertText(text, fmt)
+
+    def _update_table_cells(self, changed_keys):
+        """값이 바뀐 카메라의 셀만 QTextCursor로 갱신합니다. (표 구조/라벨은 그대로인 경우)"""
+        sum_table = self._sum_table
+        rt_table = self._rt_table
+        sum_doc = self.ui.people_summary.document()
+        rt_doc = self.ui.personnel_count_label.document()
+        # 편집을 한 트랜잭션으로 묶어 레이아웃 갱신을 1회로 병합
+        sum_edit = QTextCursor(sum_doc)
+        rt_edit = QTextCursor(rt_doc)
+        sum_edit.beginEditBlock()
+        rt_edit.beginEditBlock()
+        try:
+            for key in changed_keys:
+                idx = self._table_row_index[key]
+                _label, sum_values, rt_values = self._row_values_cache[key]
+                # 집계 표: 헤더 1행 + 카메라당 4행 (라벨 + 기간 3행), 값은 1~4열
+                base = 1 + idx * 4 + 1
+                for p, vals in enumerate(sum_values):
+                    for i, v in enumerate(vals):
+                        self._set_table_cell_text(sum_table, base + p, i + 1, str(v))
+                # 실시간 표: 헤더 1행 + 카메라당 2행 (라벨 + 카운트), 값은 0~3열
+                row = 1 + idx * 2 + 1
+                for i, v in enumerate(rt_values):
+                    self._set_table_cell_text(rt_table, row, i, str(v))
+        finally:
+            sum_edit.endEditBlock()
+            rt_edit.endEditBlock()
+
+    @staticmethod
+    def _build_camera_row_values(cam, sum_grid, is_connected, cam_counts):
+        """카메라 1대의 집계/실시간 표 셀 값을 계산합니다.
+        (sum_grid: 기간 x Area 집계 튜플, cam_counts: {area_id: 실시간 count})
+        Returns: (label_text, summary_values, realtime_values)"""
+        name = cam.get('name', '')
+        ip = cam.get('ip', '')
+        label_text = f"{ip} / {name}" if name else ip
+
+        # [정책] 연결됨: 값 표시 / 연결안됨: 숨김('-')
+        if not is_connected:
+            return label_text, (("-",) * 4,) * len(_TABLE_PERIODS), ("-",) * 4
+
+        # 집계 표: 기간별 집계 (1h, 24h, Total) - DB 격자를 그대로 사용
+        # 실시간 표: 카운트 행
+        rt_values = tuple(cam_counts.get(aid, 0) for aid in range(1, 5))
+        return label_text, sum_grid, rt_values
 
     def log_stats_debug(self):
         """주기적으로 집계 상태를 디버그 로그로 출력"""
-        if not self.ui.chk_show_debug.isChecked():
+        if not self._debug_enabled:
             return
             
-        cameras = self.cfg_mgr.get_cameras()
+        cameras = self._camera_by_key.values()
+        # 전체 카메라의 1h, 24h, Total 집계 및 행 수를 1회 쿼리로 조회
+        stats_by_key = db_module.get_people_count_stats_debug_multi([cam['key'] for cam in cameras])
         for cam in cameras:
             key = cam['key']
-            # 1h, 24h, Total 집계 및 행 수 조회
-            s1h, r1h = db_module.get_people_count_stats_debug(key, 1)
-            s24h, r24h = db_module.get_people_count_stats_debug(key, 24)
-            stot, rtot = db_module.get_people_count_stats_debug(key, None)
+            by_period = stats_by_key.get(key, {})
+            s1h, r1h = by_period.get(1, ({}, 0))
+            s24h, r24h = by_period.get(24, ({}, 0))
+            stot, rtot = by_period.get(None, ({}, 0))
             
             sum1h = sum(s1h.values())
             sum24h = sum(s24h.values())
@@ -1814,13 +2115,14 @@ class WindowSum(QMainWindow):
 
     def check_thread_health(self):
         """스레드 및 비디오 상태 모니터링 및 자동 복구"""
-        now = time.time()
+        now = time.monotonic_ns()
+        restart_cooldown_ns = 60 * 1_000_000_000
         
         # 1. 이벤트 스레드 점검
         for key, threads in self.event_threads.items():
             # 쿨다운 체크 (60초)
-            last_ts = self._last_restart_time_event.get(key, 0)
-            if now - last_ts < 60:
+            last_ts = self._last_restart_time_event.get(key)
+            if last_ts is not None and now - last_ts < restart_cooldown_ns:
                 continue
 
             restarted = False
@@ -1836,19 +2138,15 @@ class WindowSum(QMainWindow):
                     
                     if is_connected:
                         # [FIX-2] 재시작이 이미 진행 중이면 건너뛰기
-                        if self._pc_restart_inflight.get(key, False):
+                        if (key, "people") in self._cgi_restart_inflight:
                             continue
 
-                        self._pc_restart_inflight[key] = True
-                        try:
-                            allow, suppressed = should_log(f"health_pc_recovery_{key}", 300)
-                            if allow:
-                                msg = f"[Recovery] Restarting PeopleCount thread for {key} (reason=dead)" + (f" (suppressed {suppressed})" if suppressed > 0 else "")
-                                logger.info(msg)
-                            pt.restart()
-                            restarted = True
-                        finally:
-                            self._pc_restart_inflight[key] = False
+                        allow, suppressed = allow_burst(f"health_pc_recovery_{key}", _HEALTH_LOG_RATE, _HEALTH_LOG_BURST)
+                        if allow:
+                            msg = f"[Recovery] Restarting PeopleCount thread for {key} (reason=dead)" + (f" (suppressed {suppressed})" if suppressed > 0 else "")
+                            logger.info(msg)
+                        self._restart_cgi_thread_async(key, "people", pt)
+                        restarted = True
                     else:
                         # [Commit H1-2] 연결 끊김으로 인한 스킵 로그 (1시간 제한)
                         allow_skip, _ = should_log(f"health_pc_skip_disconnected_{key}", 3600)
@@ -1858,12 +2156,12 @@ class WindowSum(QMainWindow):
             # StayDetectionThread
             st = threads.get("stay")
             if st:
-                if not st.isRunning():
-                    allow, suppressed = should_log(f"health_restart_stay_{key}", 300)
+                if not st.isRunning() and (key, "stay") not in self._cgi_restart_inflight:
+                    allow, suppressed = allow_burst(f"health_restart_stay_{key}", _HEALTH_LOG_RATE, _HEALTH_LOG_BURST)
                     if allow:
                         msg = f"[Recovery] Restarting StayDetection thread for {key}" + (f" (suppressed {suppressed})" if suppressed > 0 else "")
                         logger.info(msg)
-                    st.restart()
+                    self._restart_cgi_thread_async(key, "stay", st)
                     restarted = True
                 # [Commit 19-1] StayDetection은 정상 Idle이 길 수 있으므로 Stall 체크 제외
             
@@ -1877,42 +2175,52 @@ class WindowSum(QMainWindow):
                 continue
 
             # 비디오도 동일한 쿨다운 적용
-            last_ts = self._last_restart_time_video.get(key, 0)
-            if now - last_ts < 60:
+            last_ts = self._last_restart_time_video.get(key)
+            if last_ts is not None and now - last_ts < restart_cooldown_ns:
                 continue
 
             video = tile_data['video']
             # 사용자가 정지하지 않았는데 재생 중이 아니면 재시작
             if not video.is_stopping and not video.is_playing():
-                allow, suppressed = should_log(f"health_restart_video_{key}", 300)
+                allow, suppressed = allow_burst(f"health_restart_video_{key}", _HEALTH_LOG_RATE, _HEALTH_LOG_BURST)
                 if allow:
                     msg = f"[Recovery] Restarting VideoWidget for {key}" + (f" (suppressed {suppressed})" if suppressed > 0 else "")
                     logger.info(msg)
                 video.restart()
                 self._last_restart_time_video[key] = now
 
+    def _restart_cgi_thread_async(self, key, kind, thread):
+        """CGI 스레드 재시작: 블로킹되는 stop/join은 풀 스레드에서, start는 완료 후 GUI 스레드에서"""
+        self._cgi_restart_inflight.add((key, kind))
+        worker = CgiRestartWorker(key, kind, thread)
+        worker.signals.stopped.connect(self._on_cgi_thread_stopped)
+        self.threadpool.start(worker)
+
+    @Slot(str, str)
+    def _on_cgi_thread_stopped(self, key, kind):
+        """재시작 대상 CGI 스레드 정지 완료 -> 아직 관리 중인 스레드일 때만 다시 시작"""
+        self._cgi_restart_inflight.discard((key, kind))
+        if self._closing:
+            return
+        # 대기 중 카메라 정리/이벤트 재시작으로 교체된 경우 건드리지 않음
+        thread = self.event_threads.get(key, {}).get(kind)
+        if thread is not None and not thread.isRunning():
+            thread.start()
+
     def update_system_status(self):
-        """시스템 CPU/MEM 사용량 갱신"""
-        cpu = 0
-        mem = 0
-        
-        if HAS_PSUTIL:
-            try:
-                cpu = psutil.cpu_percent()
-                mem = psutil.virtual_memory().percent
-            except Exception:
-                pass
-        else:
-            # Fallback: psutil 없을 경우 임의의 값 (테스트용)
-            import random
-            cpu = random.randint(10, 30)
-            mem = random.randint(30, 60)
-            
-        if hasattr(self.ui, 'cpu_bar'):
+        """시스템 CPU/MEM 표시 폴백 (psutil 미설치로 SysStatSampler가 동작하지 않을 때만 tick에서 호출)"""
+        # Fallback: psutil 없을 경우 임의의 값 (테스트용)
+        import random
+        self._set_system_bars(random.randint(10, 30), random.randint(30, 60))
+
+    @Slot(float, float)
+    def _set_system_bars(self, cpu, mem):
+        """CPU/MEM 사용률 표시 (SysStatSampler.stats_updated 수신)"""
+        if self.ui.cpu_bar is not None:
             self.ui.cpu_bar.setValue(int(cpu))
             self.ui.cpu_bar.setFormat(f"CPU: {cpu}%")
             
-        if hasattr(self.ui, 'mem_bar'):
+        if self.ui.mem_bar is not None:
             self.ui.mem_bar.setValue(int(mem))
             self.ui.mem_bar.setFormat(f"MEM: {mem}%")
 
@@ -1921,11 +2229,10 @@ class WindowSum(QMainWindow):
         self._closing = True
         
         # 타이머 정지
-        if self.health_timer.isActive(): self.health_timer.stop()
-        if self.sys_status_timer.isActive(): self.sys_status_timer.stop()
-        if self.stats_log_timer.isActive(): self.stats_log_timer.stop()
-        if self.ui_update_timer.isActive(): self.ui_update_timer.stop()
-        if self.log_rotate_timer.isActive(): self.log_rotate_timer.stop()
+        if self._tick.isActive(): self._tick.stop()
+        self._status_refresh_timer.stop()
+        self._log_flush_timer.stop()
+        self._sys_stat.stop()
         logger.info("[Main] Timers stopped")
 
         # 현재 선택된 카메라 키 저장
@@ -1972,19 +2279,29 @@ class WindowSum(QMainWindow):
     # ---------------------------------------------------------
     def eventFilter(self, obj, event):
         """애플리케이션 전체 이벤트 필터링 (사용자 활동 감지)"""
+        # 대부분의 이벤트(페인트/타이머 등)는 타입 비교 1회 후 즉시 통과
         # [Commit M2-3] MouseMove 제외 (노이즈 방지)
-        if event.type() in (QEvent.Type.MouseButtonPress, 
-                            QEvent.Type.KeyPress, QEvent.Type.Wheel):
-            self._last_user_activity_ts = time.time()
+        if event.type() not in _USER_ACTIVITY_EVENTS:
+            return False
+        # 연속 입력(키 반복/휠 스크롤)은 1초 단위로만 기록
+        now = time.monotonic_ns()
+        if now - self._last_user_activity_ts > 1_000_000_000:
+            self._last_user_activity_ts = now
             self._auto_stop_fired = False
-        return super().eventFilter(obj, event)
+        return False
 
     def _is_video_playing(self) -> bool:
         """현재 영상이 하나라도 재생 중인지 확인"""
-        for tile in self.tiles.values():
-            if tile.get('video') and tile['video'].is_playing():
-                return True
-        return False
+        return bool(self._playing_keys)
+
+    @Slot(str, bool)
+    def _on_video_playing_changed(self, key, playing):
+        """VideoWidget 재생 상태 변경 반영 (상태바/Idle 판단용 집합 유지)"""
+        if playing:
+            self._playing_keys.add(key)
+        else:
+            self._playing_keys.discard(key)
+        self._request_status_update()
 
     def _check_idle_stop(self):
         """Idle 상태 체크 및 자동 종료"""
@@ -2001,8 +2318,8 @@ class WindowSum(QMainWindow):
         if self._auto_stop_fired:
             return
 
-        now = time.time()
-        if now - self._last_user_activity_ts >= self.idle_stop_sec:
+        now = time.monotonic_ns()
+        if now - self._last_user_activity_ts >= self._idle_stop_ns:
             msg = "[Main] Auto-stopped monitoring due to inactivity while video playing"
             logger.info(msg)
             self.add_event_log("[Main] Auto-stopped monitoring due to inactivity")
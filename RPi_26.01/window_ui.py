@@ -1,8 +1,10 @@
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, 
                                QLabel, QPushButton, QListWidget, QListWidgetItem, QStatusBar, QFrame, 
-                               QTabWidget, QGroupBox, QFormLayout, QLineEdit, QTextEdit, 
-                               QProgressBar, QCheckBox, QMessageBox, QSizePolicy)
-from PySide6.QtCore import Qt, Signal, QSize
+                               QTabWidget, QGroupBox, QFormLayout, QLineEdit, QTextEdit, QPlainTextEdit, 
+                               QProgressBar, QCheckBox, QMessageBox, QSizePolicy, QListView, QApplication, QToolTip)
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QAbstractListModel, QModelIndex, QTimer, QRectF, QEvent
+from PySide6.QtGui import QColor, QPixmap, QPainter, QPen
+from collections import deque
 
 RIGHT_PANEL_WIDTH = 380
 
@@ -125,7 +127,7 @@ QLineEdit::placeholder {
     color: #A0AEC0;
 }
 
-QTextEdit {
+QTextEdit, QPlainTextEdit {
     background-color: #F7F9FC;
     color: #2D3748;
     border: 1px solid #DDE3EC;
@@ -137,7 +139,7 @@ QTextEdit {
     selection-background-color: #1E3A5F;
     selection-color: #FFFFFF;
 }
-QTextEdit:focus {
+QTextEdit:focus, QPlainTextEdit:focus {
     border: 1.5px solid #2E5F9E;
 }
 
@@ -226,23 +228,23 @@ QCheckBox::indicator:checked:hover {
     background-color: #2E5F9E;
 }
 
-/* ── 리스트 위젯 ──────────────────────────────────────────────────────── */
-QListWidget {
+/* ── 리스트 위젯 (QListView 선택자는 QListWidget에도 적용됨) ─────────────── */
+QListView {
     background-color: #FFFFFF;
     border: 1px solid #DDE3EC;
     border-radius: 8px;
     color: #2D3748;
     outline: none;
 }
-QListWidget::item {
+QListView::item {
     padding: 2px 0px;
     border-bottom: 1px solid #F0F2F5;
 }
-QListWidget::item:selected {
+QListView::item:selected {
     background-color: transparent;
     color: #2D3748;
 }
-QListWidget::item:hover:!selected {
+QListView::item:hover:!selected {
     background-color: #F7F9FC;
 }
 
@@ -258,8 +260,8 @@ QProgressBar {
     height: 18px;
 }
 QProgressBar::chunk {
-    background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 #1E3A5F, stop:1 #2E5F9E);
+    /* 단색 채움 (그라디언트는 값 갱신마다 다시 래스터화됨) */
+    background-color: #1E3A5F;
     border-radius: 4px;
 }
 
@@ -309,9 +311,195 @@ QFrame {
 /* ── 메시지박스 ───────────────────────────────────────────────────────── */
 QMessageBox { background-color: #FFFFFF; }
 QMessageBox QLabel { color: #2D3748; }
+
+/* ── 카메라 카드 (CameraListItem) ─────────────────────────────────────── */
+/* 카드 배경/테두리는 CameraListItem.paintEvent에서 직접 그림, 상태는 동적 프로퍼티(status)로 전환 */
+CameraListItem QLabel { background-color: transparent; }
+CameraListItem QCheckBox { background-color: transparent; }
+QLabel#cam_ip {
+    color: #2D3748;
+    font-size: 9pt;
+    font-weight: 600;
+    font-family: 'Consolas', monospace;
+}
+QLabel#cam_name {
+    font-weight: 500;
+    font-size: 9pt;
+    color: #64748B;
+}
+QLabel#cam_caption {
+    font-weight: 700;
+    color: #64748B;
+    font-size: 7.5pt;
+    letter-spacing: 0.5px;
+    text-transform: uppercase;
+}
+QLabel#cam_area_info {
+    color: #64748B;
+    font-size: 7.5pt;
+    font-weight: 600;
+}
+
+/* 연결 상태 */
+QLabel#cam_status {
+    color: #C0392B;
+    font-weight: 600;
+    font-size: 8pt;
+    background-color: transparent;
+}
+QLabel#cam_status[status="connected"] {
+    color: #1A7F4B;
+    font-weight: 700;
+}
 """
 
-__all__ = ['WindowUI', 'CameraListItem']
+__all__ = ['WindowUI', 'CameraListItem', 'EventLogModel']
+
+def _set_style_property(widget, name, value):
+    """QSS 선택자용 동적 프로퍼티를 설정하고, 값이 바뀐 경우에만 스타일을 다시 적용합니다."""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
+
+# 카메라 카드 색상 (PROFESSIONAL_QSS 팔레트와 동일)
+_CARD_BG = QColor("#FFFFFF")
+_CARD_BORDER = QColor("#DDE3EC")
+_CARD_BG_SELECTED = QColor("#EBF1FB")
+_CARD_BORDER_SELECTED = QColor("#C0D0E8")
+_CARD_ACCENT = QColor("#1E3A5F")
+_TOGGLE_BORDER = QColor("#B0BDD0")
+_TOGGLE_TEXT = QColor("#2D3748")
+_LED_ON_FILL = QColor("#2E5F9E")
+
+_LED_SIZE = 10
+_LED_PIXMAPS = {} # {is_on: QPixmap} - 모든 카드가 공유 (QApplication 생성 후 첫 사용 시 생성)
+
+def _led_pixmap(is_on):
+    """영역 LED 픽스맵 (ON: 네이비 블루 / OFF: 연한 블루그레이)"""
+    pix = _LED_PIXMAPS.get(is_on)
+    if pix is None:
+        fill, border = (_LED_ON_FILL, _CARD_ACCENT) if is_on else (_CARD_BORDER, _TOGGLE_BORDER)
+        pix = QPixmap(_LED_SIZE, _LED_SIZE)
+        pix.fill(Qt.transparent)
+        painter = QPainter(pix)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(border, 1))
+        painter.setBrush(fill)
+        painter.drawEllipse(QRectF(0.5, 0.5, _LED_SIZE - 1, _LED_SIZE - 1))
+        painter.end()
+        _LED_PIXMAPS[is_on] = pix
+    return pix
+
+class EventLogModel(QAbstractListModel):
+    """이벤트 로그 표시용 리스트 모델 (최대 행 수 초과 시 가장 오래된 행부터 제거)"""
+
+    def __init__(self, max_rows=200, parent=None):
+        super().__init__(parent)
+        self._max_rows = max_rows
+        self._rows = deque() # [(text, is_alarm)]
+        self._alarm_color = QColor(Qt.GlobalColor.red)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        text, is_alarm = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return text
+        if role == Qt.ForegroundRole and is_alarm:
+            return self._alarm_color
+        return None
+
+    def append_row(self, text, is_alarm=False):
+        """행 1개를 끝에 추가 (가득 찼으면 맨 앞 행 제거 후 추가)"""
+        self.extend_rows([(text, is_alarm)])
+
+    def extend_rows(self, rows):
+        """여러 행을 끝에 추가 (제거/삽입 통지는 각각 1회)"""
+        rows = list(rows)[-self._max_rows:]
+        if not rows:
+            return
+        overflow = len(self._rows) + len(rows) - self._max_rows
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self._rows.popleft()
+            self.endRemoveRows()
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
+
+
+class AreaToggleStrip(QWidget):
+    """
+    영역 선택 토글 N개를 한 위젯에서 직접 그립니다. (카드마다 QCheckBox N개 생성 대체)
+    모양은 전역 QSS의 QCheckBox::indicator와 동일 (15px, 테두리 #B0BDD0, 체크 시 #1E3A5F 채움)
+    """
+    toggled = Signal(int, bool) # area_id(1~N), checked
+
+    _BOX = 15
+    _TEXT_GAP = 7  # QCheckBox spacing
+    _CELL_GAP = 15 # 기존 체크박스 간 간격
+
+    def __init__(self, count=4, parent=None):
+        super().__init__(parent)
+        self._states = [False] * count
+        self._labels = [str(i + 1) for i in range(count)]
+        fm = self.fontMetrics()
+        self._text_w = max(fm.horizontalAdvance(t) for t in self._labels)
+        self._cell_w = self._BOX + self._TEXT_GAP + self._text_w
+        width = count * self._cell_w + (count - 1) * self._CELL_GAP
+        self.setFixedSize(width, max(self._BOX + 2, fm.height()))
+        self.setCursor(Qt.PointingHandCursor)
+
+    def is_checked(self, area_id):
+        return self._states[area_id - 1]
+
+    def set_checked(self, area_id, checked):
+        """상태 설정 (시그널 없음 - 저장된 상태 복원용)"""
+        checked = bool(checked)
+        if self._states[area_id - 1] != checked:
+            self._states[area_id - 1] = checked
+            self.update()
+
+    def mousePressEvent(self, event):
+        if event.button() != Qt.LeftButton:
+            return super().mousePressEvent(event)
+        # x 좌표로 칸 판정 (칸 사이 간격 클릭은 무시)
+        x = int(event.position().x())
+        idx, offset = divmod(x, self._cell_w + self._CELL_GAP)
+        if 0 <= idx < len(self._states) and offset < self._cell_w:
+            checked = not self._states[idx]
+            self._states[idx] = checked
+            self.update()
+            self.toggled.emit(idx + 1, checked)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        box_y = (self.height() - self._BOX) / 2
+        step = self._cell_w + self._CELL_GAP
+        for i, checked in enumerate(self._states):
+            x = i * step
+            painter.setPen(QPen(_CARD_ACCENT if checked else _TOGGLE_BORDER, 1.5))
+            painter.setBrush(_CARD_ACCENT if checked else _CARD_BG)
+            painter.drawRoundedRect(QRectF(x + 0.75, box_y + 0.75, self._BOX - 1.5, self._BOX - 1.5), 3, 3)
+            painter.setPen(_TOGGLE_TEXT)
+            text_x = x + self._BOX + self._TEXT_GAP
+            painter.drawText(QRectF(text_x, 0, self._text_w, self.height()), Qt.AlignVCenter | Qt.AlignLeft, self._labels[i])
+        painter.end()
 
 class CameraListItem(QWidget):
     """설정 탭의 카메라 리스트 아이템용 커스텀 위젯 (1121 스타일)"""
@@ -321,16 +509,19 @@ class CameraListItem(QWidget):
         super().__init__(parent)
         self.cam_data = cam_data
         self.key = cam_data.get('key', '')
+        self._state_mgr = state_mgr
         self._selected = False
 
-        # 카드 기본 스타일 (미선택)
-        self.setAutoFillBackground(True)
-        self._apply_card_style(selected=False)
+        # 카드 배경은 paintEvent에서 전체 영역을 직접 채움 (부모 배경 그리기 생략)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
 
-        # 메인 레이아웃 (가로)
-        layout = QHBoxLayout(self)
+        # 메인 레이아웃: 카드당 QGridLayout 1개 (중첩 레이아웃 없이 행/열 지정 배치)
+        # 행: 0/4는 세로 가운데 정렬용 여백, 1~3 내용
+        # 열: 0 모니터 체크 | 1 IP/이름/상태 | 2 캡션+영역 토글 | 3 여백 | 4~7 LED (영역 정보는 3~7 병합)
+        layout = QGridLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
-        layout.setSpacing(10)
+        layout.setHorizontalSpacing(10)
+        layout.setVerticalSpacing(2)
         
         # 1. 모니터링 체크박스
         self.chk_monitor = QCheckBox()
@@ -338,104 +529,116 @@ class CameraListItem(QWidget):
         # 상태 복원 및 저장 연결
         if state_mgr:
             self.chk_monitor.setChecked(state_mgr.get_monitor_enabled(self.key))
-            self.chk_monitor.stateChanged.connect(lambda state: state_mgr.set_monitor_enabled(self.key, state == Qt.CheckState.Checked.value))
-        layout.addWidget(self.chk_monitor)
-        
-        # 2. 정보 (IP, 이름, 연결상태) - 세로 배치
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(2)
-        info_layout.setAlignment(Qt.AlignVCenter)
+            self.chk_monitor.stateChanged.connect(self._on_monitor_toggled)
+        layout.addWidget(self.chk_monitor, 1, 0, 3, 1, Qt.AlignVCenter)
         
+        # 2. 정보 (IP, 이름, 연결상태) - 1열 세로 배치
         ip_text = cam_data.get('ip', '0.0.0.0')
         self.lbl_ip = QLabel(f"{ip_text}")
-        self.lbl_ip.setStyleSheet("color: #2D3748; font-size: 9pt; font-weight: 600; font-family: 'Consolas', monospace;")
+        self.lbl_ip.setObjectName("cam_ip")
         
         display_name = cam_data.get('name') or cam_data.get('key', '')
         self.lbl_name = QLabel(f"{display_name}")
-        self.lbl_name.setStyleSheet("font-weight: 500; font-size: 9pt; color: #64748B;")
+        self.lbl_name.setObjectName("cam_name")
         
         is_connected = cam_data.get('connected', False)
         self.lbl_status = QLabel()
+        self.lbl_status.setObjectName("cam_status")
+        self._connected = None # 마지막 적용 연결 상태 (동일 상태 재적용 시 생략)
         self.set_status(is_connected)
         
-        info_layout.addWidget(self.lbl_ip)
-        info_layout.addWidget(self.lbl_name)
-        info_layout.addWidget(self.lbl_status)
-        layout.addLayout(info_layout, stretch=2)
-        
-        # 3. 중앙 영역 (횡단대기자 라벨 + 체크박스)
-        center_layout = QVBoxLayout()
-        center_layout.setAlignment(Qt.AlignCenter)
-        center_layout.setSpacing(5)
+        layout.addWidget(self.lbl_ip, 1, 1)
+        layout.addWidget(self.lbl_name, 2, 1)
+        layout.addWidget(self.lbl_status, 3, 1)
         
-        # "횡단대기자" 라벨
+        # 3. 중앙 영역 (횡단대기자 라벨 + 영역 토글)
         lbl_center = QLabel("횡단대기자")
-        lbl_center.setStyleSheet(
-            "font-weight: 700; color: #64748B; font-size: 7.5pt; "
-            "letter-spacing: 0.5px; text-transform: uppercase;"
-        )
+        lbl_center.setObjectName("cam_caption")
         lbl_center.setAlignment(Qt.AlignCenter)
-        center_layout.addWidget(lbl_center)
+        layout.addWidget(lbl_center, 1, 2, Qt.AlignHCenter | Qt.AlignBottom)
         
-        # 영역 체크박스 (가로)
-        area_chk_layout = QHBoxLayout()
-        area_chk_layout.setAlignment(Qt.AlignCenter)
-        area_chk_layout.setSpacing(15)
-        self.area_checks = []
-        
-        for i in range(4):
-            area_id = i + 1
-            chk = QCheckBox(f"{area_id}")
-            # 상태 복원
-            if state_mgr:
-                chk.setChecked(state_mgr.get_area_enabled(self.key, area_id))
-            
-            chk.stateChanged.connect(lambda state, aid=area_id: self.sig_area_changed.emit(self.key, aid, state == Qt.CheckState.Checked.value))
-            self.area_checks.append(chk)
-            area_chk_layout.addWidget(chk)
-            
-        center_layout.addLayout(area_chk_layout)
-        layout.addLayout(center_layout, stretch=3)
+        # 영역 선택 토글 1~4 (QCheckBox 4개 대신 직접 그리는 위젯 1개)
+        self.area_toggles = AreaToggleStrip(4)
+        # 상태 복원
+        if state_mgr:
+            for area_id in range(1, 5):
+                self.area_toggles.set_checked(area_id, state_mgr.get_area_enabled(self.key, area_id))
+        self.area_toggles.toggled.connect(self._on_area_toggled)
+        layout.addWidget(self.area_toggles, 2, 2, 2, 1, Qt.AlignHCenter | Qt.AlignTop)
 
         # 4. 우측 열 (설정된 영역 정보 + LED)
-        right_layout = QVBoxLayout()
-        right_layout.setAlignment(Qt.AlignCenter)
-        right_layout.setSpacing(5)
-        
         self.lbl_area_info = QLabel("설정된 영역: -개")
         self.lbl_area_info.setAlignment(Qt.AlignRight)
-        self.lbl_area_info.setStyleSheet("color: #64748B; font-size: 7.5pt; font-weight: 600;")
-        right_layout.addWidget(self.lbl_area_info)
+        self.lbl_area_info.setObjectName("cam_area_info")
+        layout.addWidget(self.lbl_area_info, 1, 3, 1, 5, Qt.AlignRight | Qt.AlignBottom)
         
         # LED (가로) - 체크박스와 분리됨
-        led_layout = QHBoxLayout()
-        led_layout.setAlignment(Qt.AlignRight)
-        led_layout.setSpacing(8)
         self.area_leds = {} # {area_id: QLabel}
+        self._led_on = {} # {area_id: bool} - 마지막 적용 상태 (동일 상태 재적용 시 스타일시트 갱신 생략)
+        self._pending_leds = {} # {area_id: bool} - 이벤트 루프 1회 동안 모은 LED 변경 (마지막 값만 반영)
+        # 위젯 자식 타이머 (카드가 교체/삭제되면 함께 정리됨)
+        self._led_flush_timer = QTimer(self)
+        self._led_flush_timer.setSingleShot(True)
+        self._led_flush_timer.setInterval(0)
+        self._led_flush_timer.timeout.connect(self._flush_leds)
         
         for i in range(4):
             area_id = i + 1
             led = QLabel()
-            led.setFixedSize(10, 10)
-            # 초기 상태: OFF
-            led.setStyleSheet("background-color: #DDE3EC; border-radius: 5px; border: 1px solid #B0BDD0;")
-            led.setToolTip(f"Area {area_id} Status")
+            led.setFixedSize(_LED_SIZE, _LED_SIZE)
+            # 초기 상태: OFF (공유 픽스맵 - 스타일시트 경로를 거치지 않음)
+            led.setPixmap(_led_pixmap(False))
+            # 툴팁은 LED마다 두지 않고 카드의 event()에서 필요할 때 생성
+            led.setAttribute(Qt.WA_Hover, False)
             self.area_leds[area_id] = led
-            led_layout.addWidget(led)
-            
-        right_layout.addLayout(led_layout)
-        layout.addLayout(right_layout, stretch=2)
+            layout.addWidget(led, 2, 4 + i, 2, 1, Qt.AlignTop)
+
+        # 기존 가로 배치 비율 (정보 2 : 중앙 3 : 우측 2) 유지
+        layout.setColumnStretch(1, 2)
+        layout.setColumnStretch(2, 3)
+        layout.setColumnStretch(3, 2)
+        layout.setRowStretch(0, 1)
+        layout.setRowStretch(4, 1)
+
+    def event(self, event):
+        # LED 툴팁: LED 위에서 툴팁 요청 시에만 영역 번호 계산 (자식 LED에 툴팁이 없으므로 카드로 전달됨)
+        if event.type() == QEvent.ToolTip:
+            child = self.childAt(event.pos())
+            for area_id, led in self.area_leds.items():
+                if led is child:
+                    QToolTip.showText(event.globalPos(), f"Area {area_id} Status", self)
+                    return True
+            QToolTip.hideText()
+            event.ignore()
+            return True
+        return super().event(event)
+
+    @Slot(int)
+    def _on_monitor_toggled(self, state):
+        """모니터링 체크 상태 저장"""
+        self._state_mgr.set_monitor_enabled(self.key, state == Qt.CheckState.Checked.value)
+
+    @Slot(int, bool)
+    def _on_area_toggled(self, area_id, checked):
+        """영역 토글 변경 알림"""
+        self.sig_area_changed.emit(self.key, area_id, checked)
 
     def set_area_led(self, area_id: int, is_on: bool):
         """특정 영역의 LED 상태를 설정합니다."""
         if area_id in self.area_leds:
-            led = self.area_leds[area_id]
-            if is_on:
-                # ON: 네이비 블루
-                led.setStyleSheet("background-color: #2E5F9E; border-radius: 5px; border: 1px solid #1E3A5F;")
-            else:
-                # OFF: 연한 블루그레이
-                led.setStyleSheet("background-color: #DDE3EC; border-radius: 5px; border: 1px solid #B0BDD0;")
+            # 연속 호출은 모아서 다음 이벤트 루프에서 1회만 스타일 반영
+            self._pending_leds[area_id] = is_on
+            if not self._led_flush_timer.isActive():
+                self._led_flush_timer.start()
+
+    def _flush_leds(self):
+        """대기 중인 LED 변경 중 실제로 바뀐 것만 적용합니다."""
+        pending, self._pending_leds = self._pending_leds, {}
+        for area_id, is_on in pending.items():
+            if self._led_on.get(area_id, False) == is_on:
+                continue
+            self._led_on[area_id] = is_on
+            self.area_leds[area_id].setPixmap(_led_pixmap(is_on))
 
     def set_area_count(self, area_id: int, count: int | None):
         """인원수에 따라 LED 상태를 갱신합니다."""
@@ -447,7 +650,7 @@ class CameraListItem(QWidget):
         """카메라 장비 정보 업데이트 (연결상태, 설정된 영역 수)"""
         self.set_status(connected)
         count_str = f"{area_count}" if connected else "-"
-        self.lbl_area_info.setText(f"설정된 영역: {count_str}개")
+        self._set_area_info_text(f"설정된 영역: {count_str}개")
 
     def set_connected(self, connected: bool):
         """연결 상태에 따라 텍스트와 색상을 갱신합니다."""
@@ -458,66 +661,60 @@ class CameraListItem(QWidget):
         # 연결이 끊기면 LED를 모두 끄거나(회색), 숨길 수 있음.
         # 여기서는 LED를 OFF(회색) 상태로 초기화하여 '표시하지 않음' 효과를 냄
         if not visible:
+            off_pix = _led_pixmap(False)
             for led in self.area_leds.values():
-                led.setStyleSheet("background-color: #DDE3EC; border-radius: 5px; border: 1px solid #B0BDD0;")
+                led.setPixmap(off_pix)
+            self._led_on.clear()
+            self._pending_leds.clear()
 
     def set_status(self, connected):
-        if connected:
-            self.lbl_status.setText("● 연결됨")
-            self.lbl_status.setStyleSheet(
-                "color: #1A7F4B; font-weight: 700; font-size: 8pt; background-color: transparent;"
-            )
-        else:
-            self.lbl_status.setText("○ 연결 안됨")
-            self.lbl_status.setStyleSheet(
-                "color: #C0392B; font-weight: 600; font-size: 8pt; background-color: transparent;"
-            )
+        connected = bool(connected)
+        if self._connected == connected:
+            return
+        self._connected = connected
+        self.lbl_status.setText("● 연결됨" if connected else "○ 연결 안됨")
+        _set_style_property(self.lbl_status, "status", "connected" if connected else "disconnected")
     
     def update_area_count(self, count):
         """동적 발견된 영역 수 업데이트"""
         # 기존 로직 유지: 연결 상태가 True일 때만 숫자가 의미가 있을 수 있으나,
         # 여기서는 단순히 텍스트만 갱신
-        current_text = self.lbl_area_info.text()
         if "연결" in self.lbl_status.text(): # 연결된 상태라면
-             self.lbl_area_info.setText(f"설정된 영역: {count}개")
+            self._set_area_info_text(f"설정된 영역: {count}개")
+
+    def _set_area_info_text(self, text):
+        """영역 정보 라벨 갱신 (동일 텍스트면 setText/레이아웃 갱신 생략)"""
+        if self.lbl_area_info.text() != text:
+            self.lbl_area_info.setText(text)
 
     def set_selected(self, selected: bool):
         """QListWidget 선택 상태를 카드 자체에 반영합니다."""
+        if self._selected == selected:
+            return
         self._selected = selected
-        self._apply_card_style(selected)
-
-    def _apply_card_style(self, selected: bool):
-        """선택 여부에 따라 카드 배경/테두리를 바꿉니다."""
-        if selected:
-            self.setStyleSheet(f"""
-                CameraListItem {{
-                    background-color: #EBF1FB;
-                    border-left: 4px solid #1E3A5F;
-                    border-top: 1px solid #C0D0E8;
-                    border-right: 1px solid #C0D0E8;
-                    border-bottom: 1px solid #C0D0E8;
-                }}
-                CameraListItem QLabel {{ background-color: transparent; }}
-                CameraListItem QCheckBox {{ background-color: transparent; }}
-            """)
+        self.update()
+
+    def paintEvent(self, event):
+        """카드 배경/테두리 (선택 시 연한 네이비 배경 + 좌측 4px 강조선)"""
+        if self._selected:
+            bg, border, accent = _CARD_BG_SELECTED, _CARD_BORDER_SELECTED, _CARD_ACCENT
         else:
-            self.setStyleSheet(f"""
-                CameraListItem {{
-                    background-color: #FFFFFF;
-                    border-left: 4px solid transparent;
-                    border-top: 1px solid #DDE3EC;
-                    border-right: 1px solid #DDE3EC;
-                    border-bottom: 1px solid #DDE3EC;
-                }}
-                CameraListItem QLabel {{ background-color: transparent; }}
-                CameraListItem QCheckBox {{ background-color: transparent; }}
-            """)
+            bg, border, accent = _CARD_BG, _CARD_BORDER, None
+        w, h = self.width(), self.height()
+        painter = QPainter(self)
+        painter.fillRect(0, 0, w, h, border)
+        painter.fillRect(1, 1, w - 2, h - 2, bg)
+        if accent is not None:
+            painter.fillRect(0, 0, 4, h, accent)
+        painter.end()
 
 class WindowUI:
     """메인 윈도우의 UI 구성을 담당하는 클래스"""
     def __init__(self):
         # UI 위젯 참조 변수 초기화
         self.tabs = None
+        self._tab_info = None # 지연 구성 대기 중인 Information 탭 (구성 후 None)
+        self._selected_card = None # 선택 스타일이 적용된 CameraListItem (선택 변경 시 이전 카드만 해제)
         self.camera_list = None
         self.edit_name = None
         self.edit_ip = None
@@ -531,6 +728,7 @@ class WindowUI:
         self.btn_mon = None
         self.chk_show_debug = None
         self.list_events = None
+        self.event_log_model = None
         self.lbl_gpio_status = None
         self.video_grid = None
         self.people_summary = None
@@ -556,7 +754,13 @@ class WindowUI:
 
     def setup_ui(self, main_window: QMainWindow):
         """메인 윈도우의 레이아웃을 구성합니다."""
-        main_window.setStyleSheet(PROFESSIONAL_QSS)
+        # 전역 스타일시트는 QApplication에 1회만 설정 (창/다이얼로그가 파싱 결과를 공유)
+        app = QApplication.instance()
+        if app is not None:
+            if app.styleSheet() != PROFESSIONAL_QSS:
+                app.setStyleSheet(PROFESSIONAL_QSS)
+        else:
+            main_window.setStyleSheet(PROFESSIONAL_QSS)
         central_widget = QWidget()
         main_window.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
@@ -568,7 +772,10 @@ class WindowUI:
         # 탭 구성
         self._setup_tab_settings()
         self._setup_tab_monitoring()
-        self._setup_tab_info()
+        # Information 탭은 정적 내용뿐이므로 처음 열 때 구성 (시작 시 위젯 생성/스타일 계산 생략)
+        self._tab_info = QWidget()
+        self.tabs.addTab(self._tab_info, "Information")
+        self.tabs.currentChanged.connect(self._build_tab_info_once)
         
         # 상태 표시줄
         self.status_bar = QStatusBar()
@@ -587,6 +794,8 @@ class WindowUI:
         self.camera_list = QListWidget()
         self.camera_list.setSelectionMode(QListWidget.SingleSelection)
         self.camera_list.setSpacing(2)
+        # 카드 높이가 모두 같으므로(80px) 항목별 sizeHint 조회 없이 레이아웃 계산
+        self.camera_list.setUniformItemSizes(True)
         # 선택 변경 시 카드 스타일 갱신
         self.camera_list.currentRowChanged.connect(self._on_camera_selection_changed)
         left_layout.addWidget(self.camera_list)
@@ -643,11 +852,13 @@ class WindowUI:
         # GPIO Log (더미 UI 유지)
         gpio_group = QGroupBox("GPIO Log")
         gpio_layout = QVBoxLayout(gpio_group)
-        self.gpio_text = QTextEdit()
+        # 평문 로그이므로 QPlainTextEdit 사용 (리치텍스트 레이아웃 생략)
+        self.gpio_text = QPlainTextEdit()
         self.gpio_text.setReadOnly(True)
         self.gpio_text.setPlaceholderText("GPIO Log will appear here...")
         # [추가] 최대 라인 수 제한 (오래된 로그 자동 삭제)
-        self.gpio_text.document().setMaximumBlockCount(200)
+        self.gpio_text.setMaximumBlockCount(200)
+        self.gpio_text.setCenterOnScroll(False)
         gpio_layout.addWidget(self.gpio_text)
         
         # GPIO 하단 컨트롤
@@ -690,7 +901,13 @@ class WindowUI:
         self.chk_show_debug.setChecked(False)
         log_layout.addWidget(self.chk_show_debug, 0, 0, Qt.AlignRight)
         
-        self.list_events = QListWidget()
+        # 로그는 항목 위젯 없이 모델로 표시 (행 높이 균일 -> 레이아웃 계산 생략)
+        self.event_log_model = EventLogModel(200)
+        self.list_events = QListView()
+        self.list_events.setModel(self.event_log_model)
+        self.list_events.setUniformItemSizes(True)
+        self.list_events.setLayoutMode(QListView.Batched)
+        self.list_events.setEditTriggers(QListView.NoEditTriggers)
         log_layout.addWidget(self.list_events, 1, 0)
         main_layout.addWidget(log_group, 1, 0)
         
@@ -700,6 +917,7 @@ class WindowUI:
         main_layout.setRowStretch(0, 6)
         main_layout.setRowStretch(1, 4)
         
+        self.tab_settings = tab
         self.tabs.addTab(tab, "Settings")
 
     def _setup_tab_monitoring(self):
@@ -742,6 +960,7 @@ class WindowUI:
         sum_layout = QVBoxLayout(sum_group)
         self.people_summary = QTextEdit()
         self.people_summary.setReadOnly(True)
+        self.people_summary.setUndoRedoEnabled(False) # 셀 단위 갱신이 undo 스택에 쌓이지 않도록
         sum_layout.addWidget(self.people_summary)
         right_layout.addWidget(sum_group)
         
@@ -750,6 +969,7 @@ class WindowUI:
         rt_layout = QVBoxLayout(rt_group)
         self.personnel_count_label = QTextEdit()
         self.personnel_count_label.setReadOnly(True)
+        self.personnel_count_label.setUndoRedoEnabled(False) # 셀 단위 갱신이 undo 스택에 쌓이지 않도록
         rt_layout.addWidget(self.personnel_count_label)
         right_layout.addWidget(rt_group)
 
@@ -814,10 +1034,18 @@ class WindowUI:
         right_layout.addStretch()
         
         layout.addWidget(right_panel)
+        self.tab_monitoring = tab # 탭 순서와 무관하게 식별 (indexOf/currentWidget 비교용)
         self.tabs.addTab(tab, "Monitoring")
 
-    def _setup_tab_info(self):
-        tab = QWidget()
+    def _build_tab_info_once(self, index: int):
+        """Information 탭 최초 진입 시 내용을 구성합니다."""
+        if self._tab_info is None or self.tabs.widget(index) is not self._tab_info:
+            return
+        tab, self._tab_info = self._tab_info, None
+        self.tabs.currentChanged.disconnect(self._build_tab_info_once)
+        self._setup_tab_info(tab)
+
+    def _setup_tab_info(self, tab: QWidget):
         layout = QHBoxLayout(tab)
         
         left_layout = QVBoxLayout()
@@ -847,13 +1075,44 @@ class WindowUI:
         )
         right_layout.addWidget(lbl_logo)
         layout.addLayout(right_layout, stretch=1)
-        
-        self.tabs.addTab(tab, "Information")
+
+    def begin_bulk_camera_update(self):
+        """카메라 리스트 일괄 갱신 시작: 시그널과 화면 갱신을 보류합니다."""
+        self.camera_list.blockSignals(True)
+        self.camera_list.setUpdatesEnabled(False)
+        self.camera_list.viewport().setUpdatesEnabled(False)
+
+    def end_bulk_camera_update(self):
+        """카메라 리스트 일괄 갱신 종료: 1회 repaint 하고 카드 선택 표시를 현재 행에 맞춥니다."""
+        self.camera_list.viewport().setUpdatesEnabled(True)
+        self.camera_list.setUpdatesEnabled(True)
+        self.camera_list.blockSignals(False)
+        # 시그널 차단 중 바뀐 현재 행/교체된 카드는 currentRowChanged가 오지 않았으므로 직접 반영
+        self._sync_card_selection()
+        self.camera_list.viewport().update()
 
     def _on_camera_selection_changed(self, current_row: int):
-        """카메라 리스트 선택 변경 시 각 카드의 선택 스타일을 갱신합니다."""
+        """카메라 리스트 선택 변경 시 이전/현재 카드의 선택 스타일만 갱신합니다."""
+        item = self.camera_list.item(current_row)
+        widget = self.camera_list.itemWidget(item) if item is not None else None
+        card = widget if isinstance(widget, CameraListItem) else None
+        prev = self._selected_card
+        if prev is not None and prev is not card:
+            try:
+                prev.set_selected(False)
+            except RuntimeError:
+                pass # reload로 교체되어 이미 삭제된 카드
+        if card is not None:
+            card.set_selected(True)
+        self._selected_card = card
+
+    def _sync_card_selection(self):
+        """전체 카드의 선택 스타일을 현재 행 기준으로 맞춥니다. (일괄 갱신 후 1회)"""
+        current_row = self.camera_list.currentRow()
+        self._selected_card = None
         for i in range(self.camera_list.count()):
-            item = self.camera_list.item(i)
-            widget = self.camera_list.itemWidget(item)
+            widget = self.camera_list.itemWidget(self.camera_list.item(i))
             if isinstance(widget, CameraListItem):
                 widget.set_selected(i == current_row)
+                if i == current_row:
+                    self._selected_card = widget